@@ -85,6 +85,7 @@ def admin_page(search: str = Query(""), page: int = Query(1, ge=1)):
                 "keywords": book.keywords or "",
                 "publication_date": book.publication_date or "",
                 "isbn": book.isbn or "",
+                "cover_image_url": book.cover_image_url or "",
                 "status": book.status or "published",
                 "is_visible": book.is_visible if book.is_visible is not None else True,
                 "hidden_reason": book.hidden_reason or "",
@@ -62,10 +62,18 @@ class ArabicTocExtractor:
         r"^محتويات الكتاب$"       # "Table of Topics"
     ]
 
-    def __init__(self):
-        """Initialize the Arabic TOC extractor with compiled regex patterns."""
-        # Compile all TOC header patterns into a single regex for efficiency
-        self.toc_regex = re.compile("|".join(self.TOC_PATTERNS))
+    # Compiled once per process (class level) and shared by every instance
+    # All TOC header patterns in a single regex for efficiency
+    toc_regex = re.compile("|".join(TOC_PATTERNS))
+    # "فهرسة" followed by these words means cataloging, not a TOC header
+    _CATALOGING_RE = re.compile(r"فهرسة\s+(الكتب|المراجع|البيانات)")
+    # Page number line: digits only, or a digit range (first number is used)
+    _PAGE_NUMBER_RE = re.compile(r'^(\d+)(?:-\d+)?$')
+    _DIGITS_ONLY_RE = re.compile(r'^\d+$')
+    _RUNNING_HEADER_RE = re.compile(r'^(الفصل|الباب|Chapter|Part)\s*\d+$')
+    _UNSAFE_FILENAME_RE = re.compile(r'[^\w\s-]')
+    # Arabic-Indic digits (٠-٩) -> Western digits (0-9)
+    _ARABIC_DIGITS = str.maketrans('٠١٢٣٤٥٦٧٨٩', '0123456789')
 
     def extract(
         self,
@@ -462,8 +470,7 @@ class ArabicTocExtractor:
         Returns:
             Text with normalized digits
         """
-        arabic_to_western = str.maketrans('٠١٢٣٤٥٦٧٨٩', '0123456789')
-        return text.translate(arabic_to_western)
+        return text.translate(self._ARABIC_DIGITS)
 
     def _extract_toc_segment(self, text_part: str, context_label: str) -> Optional[str]:
         """
@@ -499,7 +506,7 @@ class ArabicTocExtractor:
             # "فهرسة" can mean "indexing/cataloging" (false positive)
             # vs "فهرس" which means "table of contents"
             # Reject if followed by non-TOC words
-            if re.search(r"فهرسة\s+(الكتب|المراجع|البيانات)", context):
+            if self._CATALOGING_RE.search(context):
                 logger.info(
                     f"Rejected false positive at {context_label}: '{match.group()}' "
                     f"in context '{context.strip()}'"
@@ -574,7 +581,7 @@ class ArabicTocExtractor:
                 next_line_normalized = self._normalize_arabic_digits(next_line)
 
                 # Check if next line is a page number (digits only or digit-digit range)
-                page_match = re.match(r'^(\d+)(?:-\d+)?$', next_line_normalized)
+                page_match = self._PAGE_NUMBER_RE.match(next_line_normalized)
 
                 if page_match:
                     # This looks like a title-page pair
@@ -599,7 +606,7 @@ class ArabicTocExtractor:
                     # Two-line title: next line is more title text, line after is the page number
                     after_next = lines[i + 2].strip()
                     after_next_normalized = self._normalize_arabic_digits(after_next)
-                    page_match2 = re.match(r'^(\d+)(?:-\d+)?$', after_next_normalized)
+                    page_match2 = self._PAGE_NUMBER_RE.match(after_next_normalized)
                     if page_match2:
                         page_num = int(page_match2.group(1))
                         if 1 <= page_num <= 9999:
@@ -687,12 +694,12 @@ class ArabicTocExtractor:
 
             # Skip if page goes backwards (but allow same page)
             if page < last_page:
-                logger.debug(f"Skipping entry (page decreased): {entry['title']} -> {page}")
+                logger.debug("Skipping entry (page decreased): %s -> %s", entry['title'], page)
                 continue
 
             # Skip if page jumps too much (likely body text contamination)
             if last_page > 0 and (page - last_page) > 500:
-                logger.debug(f"Skipping entry (page jump too large): {entry['title']} -> {page}")
+                logger.debug("Skipping entry (page jump too large): %s -> %s", entry['title'], page)
                 continue
 
             # ALLOW duplicate page numbers (multiple sections can start on same page)
@@ -723,11 +730,11 @@ class ArabicTocExtractor:
         line_normalized = self._normalize_arabic_digits(line)
 
         # Skip standalone page numbers
-        if re.match(r'^\d+$', line_normalized):
+        if self._DIGITS_ONLY_RE.match(line_normalized):
             return True
 
         # Skip common header patterns (but not TOC headers)
-        if re.match(r'^(الفصل|الباب|Chapter|Part)\s*\d+$', line):
+        if self._RUNNING_HEADER_RE.match(line):
             return True
 
         return False
@@ -736,7 +743,7 @@ class ArabicTocExtractor:
         """Write evaluation log for Arabic TOC extraction to JSON file."""
         try:
             os.makedirs(EVAL_DIR, exist_ok=True)
-            safe_title = re.sub(r'[^\w\s-]', '', eval_data.get('book_title', 'unknown'))[:50].strip().replace(' ', '_')
+            safe_title = self._UNSAFE_FILENAME_RE.sub('', eval_data.get('book_title', 'unknown'))[:50].strip().replace(' ', '_')
             filename = f"toc_eval_extract_{safe_title}.json"
             filepath = os.path.join(EVAL_DIR, filename)
 
@@ -11,6 +11,7 @@ Extracts chapter/section headings using common English patterns:
 
 import re
 import logging
+from functools import lru_cache
 from typing import List, Optional
 from ...models.schemas import SectionInfo, SectionsReport
 
@@ -48,14 +49,34 @@ class EnglishTocExtractor:
         r'^(Appendix\s+([A-Z\d]+)[\s:.–-]+(.+))$',
     ]
     
+    # All patterns in one regex, so the text is scanned once instead of once
+    # per pattern. Each alternative is a zero-width lookahead, and at any
+    # position only the first matching alternative is reported. Nothing is
+    # lost: every match starts at a line start, and the families begin with
+    # distinct tokens (digit, Chapter, Section, Part, Appendix), so at most
+    # one family can match there. Patterns 0 and 1 are identical under
+    # IGNORECASE, so pattern 1 would only repeat pattern 0's matches, which
+    # the duplicate removal drops anyway. _extract_sections() skips overlaps
+    # within a pattern, as a separate scan per pattern did. Group "p<i>"
+    # wraps PATTERNS[i]; its full/number/title groups follow it.
+    master_pattern = re.compile(
+        "|".join(f"(?=(?P<p{i}>{p}))" for i, p in enumerate(PATTERNS)),
+        re.MULTILINE | re.IGNORECASE,
+    )
+    
+    # Every pattern needs a digit, except "Part <roman>" and "Appendix <letter>";
+    # text with none of these cannot match, so the full scan is skipped.
+    # "append" rather than "appendix": str.lower() and IGNORECASE disagree on
+    # the dotted/dotless i, and a cheaper over-match is harmless here.
+    _DIGIT_RE = re.compile(r'\d')
+    _KEYWORDS = ("part", "append")
+    
     def __init__(self, min_sections: int = 3):
         """
         Args:
             min_sections: Minimum number of sections to consider extraction successful
         """
         self.min_sections = min_sections
-        self.compiled_patterns = [re.compile(p, re.MULTILINE | re.IGNORECASE) 
-                                  for p in self.PATTERNS]
     
     def extract(self, text: str, num_pages: int) -> SectionsReport:
         """
@@ -90,30 +111,46 @@ class EnglishTocExtractor:
     
     def _extract_sections(self, text: str, num_pages: int) -> List[SectionInfo]:
         """Extract sections using pattern matching."""
+        if not self._DIGIT_RE.search(text):
+            lowered = text.lower()
+            if not any(keyword in lowered for keyword in self._KEYWORDS):
+                return []
+        
         matches = []
         
-        # Try each pattern
-        for pattern in self.compiled_patterns:
-            for match in pattern.finditer(text):
-                full_text = match.group(1).strip()
-                number = match.group(2).strip()
-                title = match.group(3).strip()
-                
-                # Skip if title is too short or looks like noise
-                if len(title) < 3 or len(title) > 200:
-                    continue
-                
-                # Estimate page number from text position
-                char_pos = match.start()
-                estimated_page = max(1, min(num_pages, 
-                                           int((char_pos / len(text)) * num_pages) + 1))
-                
-                matches.append({
-                    'number': number,
-                    'title': title,
-                    'page': estimated_page,
-                    'full': full_text
-                })
+        # Single scan; at a given line start only one pattern family can match
+        ends = [0] * len(self.PATTERNS)  # where each pattern's last match ended
+        for match in self.master_pattern.finditer(text):
+            kind = match.lastgroup
+            index = int(kind[1:])
+            base = self.master_pattern.groupindex[kind]
+            if match.start() < ends[index]:
+                continue
+            ends[index] = match.end(base)
+            full_text = match.group(base + 1).strip()
+            number = match.group(base + 2).strip()
+            title = match.group(base + 3).strip()
+            
+            # Skip if title is too short or looks like noise
+            if len(title) < 3 or len(title) > 200:
+                continue
+            
+            # Estimate page number from text position
+            char_pos = match.start()
+            estimated_page = max(1, min(num_pages, 
+                                       int((char_pos / len(text)) * num_pages) + 1))
+            
+            matches.append({
+                'number': number,
+                'title': title,
+                'page': estimated_page,
+                'full': full_text,
+                'pattern': index,
+            })
+        
+        # Keep pattern-major order (as one scan per pattern produced); the sort
+        # is stable, so text order is kept within each pattern
+        matches.sort(key=lambda m: m['pattern'])
         
         if not matches:
             return []
@@ -153,7 +190,11 @@ class EnglishTocExtractor:
         
         return sections
     
-    def _determine_level(self, number: str) -> int:
+    # Pure functions of the id string, cached: the same ids recur while
+    # sorting and building sections
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _determine_level(number: str) -> int:
         """
         Determine hierarchical level from section number.
         
@@ -169,7 +210,9 @@ class EnglishTocExtractor:
             return number.count('.') + 1
         return 1
     
-    def _parse_section_number(self, number: str) -> tuple:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_section_number(number: str) -> tuple:
         """
         Parse section number into sortable tuple.
         
@@ -198,7 +198,7 @@ class TocGenerator:
             MIN_HEIGHT = 0.025  # Minimum height ratio - adjust as needed (0.02-0.03)
             if height is not None and height < MIN_HEIGHT:
                 self._eval_filtered.append({**candidate, 'reason': f'height_too_small ({height:.4f} < {MIN_HEIGHT})'})
-                logger.debug(f"Skipping small heading (height {height:.4f}): {content[:30]}")
+                logger.debug("Skipping small heading (height %.4f): %s", height, content[:30])
                 continue
 
             # Filter 3: Check font size from paragraph styles/spans
@@ -219,13 +219,13 @@ class TocGenerator:
                 continue
             if len(content) > self.MAX_HEADING_LENGTH:
                 self._eval_filtered.append({**candidate, 'reason': f'too_long ({len(content)} chars)'})
-                logger.debug(f"Skipping too-long heading: {content[:50]}...")
+                logger.debug("Skipping too-long heading: %s...", content[:50])
                 continue
 
             # Filter 5: No page number
             if page_number is None:
                 self._eval_filtered.append({**candidate, 'reason': 'no_page_number'})
-                logger.debug(f"Skipping heading without page number: {content[:50]}...")
+                logger.debug("Skipping heading without page number: %s...", content[:50])
                 continue
 
             # --- FILTERS END --- Heading accepted
@@ -248,7 +248,7 @@ class TocGenerator:
             }
 
             headings.append(heading)
-            logger.debug(f"Found heading: '{content[:50]}...' on page {page_number} (role: {role})")
+            logger.debug("Found heading: '%s...' on page %s (role: %s)", content[:50], page_number, role)
 
         # Sort by page number, then by offset within page
         headings.sort(key=lambda h: (h['page'], h['offset'] or 0))
@@ -283,7 +283,7 @@ class TocGenerator:
                         combined['y_bottom'] = nxt['y_bottom']
                         merged.append(combined)
                         skip = True
-                        logger.debug(f"Merged two-line heading: '{combined['title'][:60]}' on page {h['page']}")
+                        logger.debug("Merged two-line heading: '%s' on page %s", combined['title'][:60], h['page'])
                         continue
                 merged.append(h)
             headings = merged
@@ -971,56 +971,10 @@ def render_home() -> str:
     """
 
 
-def render_report(filename: str, report: AnalysisReport, language: str = "unknown", metadata: BookMetadata = None) -> str:
-    """Render analysis report with language detection, book metadata, and generation options."""
-    
-    # Classification badge
-    badge_map = {
-        "image_only": "<span class='badge err'>IMAGE-ONLY</span>",
-        "text_only": "<span class='badge ok'>TEXT-ONLY</span>",
-        "mixed": "<span class='badge mix'>MIXED</span>",
-    }
-    classification_badge = badge_map.get(report.classification, "")
-    
-    # Language badge
-    language_badge = f"<span class='badge {language}'>{language.upper()}</span>"
-    
-    # Book metadata section (if provided)
-    metadata_html = ""
-    if metadata:
-        metadata_rows = f"""
-            <div><strong>Book Title</strong></div><div>{metadata.title}</div>
-        """
-        if metadata.author:
-            metadata_rows += f"""
-            <div><strong>Author</strong></div><div>{metadata.author}</div>
-            """
-        if metadata.publication_date:
-            metadata_rows += f"""
-            <div><strong>Publication Date</strong></div><div>{metadata.publication_date}</div>
-            """
-        if metadata.isbn:
-            metadata_rows += f"""
-            <div><strong>ISBN</strong></div><div>{metadata.isbn}</div>
-            """
-        
-        metadata_html = f"""
-        <div style="margin-bottom: 20px;">
-          <h2 style="font-size: 18px; margin-bottom: 12px; color: var(--accent);">📚 Book Information</h2>
-          <div class="kv" style="margin-top: 0;">
-            {metadata_rows}
-          </div>
-        </div>
-        """
-    
-    # Table rows
-    rows = "\n".join(
-        f"<tr><td>{p.page}</td><td>{'Yes' if p.has_text else 'No'}</td><td>{p.image_count}</td></tr>"
-        for p in report.pages
-    )
-    
-    # Generation section
-    generation_html = """
+_METADATA_ROW = "<div><strong>{0}</strong></div><div>{1}</div>"
+
+# Static fragments of the analysis report (no interpolation needed)
+_GENERATION_HTML = """
     <div class="generation-section">
       <h3>🎨 Generate Book Formats</h3>
       <p style="color: var(--muted); margin: 0 0 20px;">Transform your PDF into beautiful, readable formats</p>
@@ -1063,10 +1017,59 @@ def render_report(filename: str, report: AnalysisReport, language: str = "unknow
       </div>
     </div>
     """
+
+_INFO_BOX_HTML = """
+      <div class="info-box" style="margin-top: 20px;">
+        <strong>📥 Raw Data Export Options:</strong><br>
+        • <a href="/export/jsonl">Download page-level data (JSONL)</a><br>
+        • <a href="/export/sections.jsonl">Download TOC/sections (JSONL)</a><br>
+        • <a href="/info">Get metadata (JSON)</a>
+      </div>
+"""
+
+
+def render_report(filename: str, report: AnalysisReport, language: str = "unknown", metadata: BookMetadata = None) -> str:
+    """Render analysis report with language detection, book metadata, and generation options."""
     
-    body = f"""
-      {metadata_html}
-      
+    # Classification badge
+    badge_map = {
+        "image_only": "<span class='badge err'>IMAGE-ONLY</span>",
+        "text_only": "<span class='badge ok'>TEXT-ONLY</span>",
+        "mixed": "<span class='badge mix'>MIXED</span>",
+    }
+    classification_badge = badge_map.get(report.classification, "")
+    
+    # Language badge
+    language_badge = f"<span class='badge {language}'>{language.upper()}</span>"
+    
+    # Book metadata section (if provided)
+    metadata_html = ""
+    if metadata:
+        pairs = [("Book Title", metadata.title)]
+        if metadata.author:
+            pairs.append(("Author", metadata.author))
+        if metadata.publication_date:
+            pairs.append(("Publication Date", metadata.publication_date))
+        if metadata.isbn:
+            pairs.append(("ISBN", metadata.isbn))
+        metadata_rows = "\n".join(_METADATA_ROW.format(label, value) for label, value in pairs)
+
+        metadata_html = f"""
+        <div style="margin-bottom: 20px;">
+          <h2 style="font-size: 18px; margin-bottom: 12px; color: var(--accent);">📚 Book Information</h2>
+          <div class="kv" style="margin-top: 0;">
+            {metadata_rows}
+          </div>
+        </div>
+        """
+    
+    # Table rows
+    rows = "\n".join(
+        f"<tr><td>{p.page}</td><td>{'Yes' if p.has_text else 'No'}</td><td>{p.image_count}</td></tr>"
+        for p in report.pages
+    )
+    
+    report_html = f"""
       <h2 style="font-size: 18px; margin-bottom: 12px; color: var(--accent);">📊 Analysis Report</h2>
       <div class="kv">
         <div><strong>File name</strong></div><div>{filename}</div>
@@ -1082,16 +1085,10 @@ def render_report(filename: str, report: AnalysisReport, language: str = "unknow
           <tbody>{rows}</tbody>
         </table>
       </details>
-
-      {generation_html}
-      
-      <div class="info-box" style="margin-top: 20px;">
-        <strong>📥 Raw Data Export Options:</strong><br>
-        • <a href="/export/jsonl">Download page-level data (JSONL)</a><br>
-        • <a href="/export/sections.jsonl">Download TOC/sections (JSONL)</a><br>
-        • <a href="/info">Get metadata (JSON)</a>
-      </div>
     """
+
+    # Static sections are module constants; only the report block is formatted
+    body = metadata_html + report_html + _GENERATION_HTML + _INFO_BOX_HTML
     return body
 
 
@@ -1132,6 +1129,18 @@ def render_admin(books_data: list, pagination: dict | None = None, all_books_lis
     _dropdown = all_books_list or [{"id": b["id"], "title": b["title"]} for b in books_data]
     all_books_json = _json.dumps(_dropdown, ensure_ascii=False)
 
+    # Edit-modal data for every book on the page, so opening the modal needs no round-trip
+    _edit_fields = ("id", "title", "description", "category", "keywords", "publication_date", "isbn")
+    _edit_data = {
+        b["id"]: {
+            **{k: b.get(k, "") for k in _edit_fields},
+            "author": b["author"] if b.get("author_id") else "",
+            "cover_image_url": b.get("cover_image_url", ""),
+        }
+        for b in books_data
+    }
+    books_json = _json.dumps(_edit_data, ensure_ascii=False, separators=(",", ":")).replace("</", "<\\/")
+
     # Build table rows
     rows = ""
     method_suffixes = {'-auto': 'Auto Detect', '-extract': 'Extract', '-generate': 'Generate'}
@@ -1171,7 +1180,7 @@ def render_admin(books_data: list, pagination: dict | None = None, all_books_lis
             <div style="display: flex; gap: 6px; align-items: center;">
               <button onclick="event.stopPropagation(); toggleVisibility({book['id']}, {str(is_visible).lower()})" class="admin-btn admin-btn-visibility" title="{visibility_title}">{visibility_icon}</button>
               <button onclick="event.stopPropagation(); openEditModal({book['id']})" class="admin-btn admin-btn-edit" title="Edit">Edit</button>
-              <button onclick="event.stopPropagation(); confirmDelete({book['id']}, '{raw_title.replace(chr(39), chr(92)+chr(39))}')" class="admin-btn admin-btn-delete" title="Delete">Delete</button>
+              <button onclick="event.stopPropagation(); confirmDelete({book['id']})" class="admin-btn admin-btn-delete" title="Delete">Delete</button>
             </div>
           </td>
         </tr>
@@ -1580,7 +1589,10 @@ def render_admin(books_data: list, pagination: dict | None = None, all_books_lis
       </div>
     </div>
 
+    <script id="books-data" type="application/json">{books_json}</script>
     <script>
+    window._BOOKS = JSON.parse(document.getElementById('books-data').textContent);
+
     function toggleVisibility(bookId, currentlyVisible) {{
       if (currentlyVisible) {{
         // Hiding — ask for reason
@@ -1629,7 +1641,8 @@ def render_admin(books_data: list, pagination: dict | None = None, all_books_lis
       }}
     }}
 
-    function confirmDelete(bookId, bookTitle) {{
+    function confirmDelete(bookId) {{
+      const bookTitle = window._BOOKS[bookId] ? window._BOOKS[bookId].title : '#' + bookId;
       if (confirm('Are you sure you want to delete "' + bookTitle + '"?\\n\\nThis will permanently delete the book and all its sections and pages.')) {{
         fetch('/admin/books/' + bookId, {{
           method: 'DELETE'
@@ -1667,41 +1680,36 @@ def render_admin(books_data: list, pagination: dict | None = None, all_books_lis
     }}
 
     function openEditModal(bookId) {{
-      fetch('/admin/books/' + bookId)
-        .then(r => {{
-          if (!r.ok) throw new Error('Failed to load book');
-          return r.json();
-        }})
-        .then(data => {{
-          _pendingCoverFile = null;
-          document.getElementById('edit-cover-file').value = '';
-          document.getElementById('edit-cover-status').style.display = 'none';
-
-          const img = document.getElementById('edit-cover-img');
-          const placeholder = document.getElementById('edit-cover-placeholder');
-          if (data.cover_image_url) {{
-            img.src = data.cover_image_url;
-            img.style.display = 'block';
-            placeholder.style.display = 'none';
-          }} else {{
-            img.src = '';
-            img.style.display = 'none';
-            placeholder.style.display = 'inline';
-          }}
+      const data = window._BOOKS[bookId];
+      if (!data) {{
+        showAlert('Failed to load book data: book ' + bookId + ' is not on this page', 'error');
+        return;
+      }}
+      _pendingCoverFile = null;
+      document.getElementById('edit-cover-file').value = '';
+      document.getElementById('edit-cover-status').style.display = 'none';
+
+      const img = document.getElementById('edit-cover-img');
+      const placeholder = document.getElementById('edit-cover-placeholder');
+      if (data.cover_image_url) {{
+        img.src = data.cover_image_url;
+        img.style.display = 'block';
+        placeholder.style.display = 'none';
+      }} else {{
+        img.src = '';
+        img.style.display = 'none';
+        placeholder.style.display = 'inline';
+      }}
 
-          document.getElementById('edit-book-id').value = data.id;
-          document.getElementById('edit-title').value = data.title;
-          document.getElementById('edit-author').value = data.author;
-          document.getElementById('edit-description').value = data.description;
-          document.getElementById('edit-category').value = data.category;
-          document.getElementById('edit-keywords').value = data.keywords;
-          document.getElementById('edit-pub-date').value = data.publication_date;
-          document.getElementById('edit-isbn').value = data.isbn;
-          document.getElementById('edit-modal').classList.add('active');
-        }})
-        .catch(err => {{
-          showAlert('Failed to load book data: ' + err.message, 'error');
-        }});
+      document.getElementById('edit-book-id').value = data.id;
+      document.getElementById('edit-title').value = data.title;
+      document.getElementById('edit-author').value = data.author;
+      document.getElementById('edit-description').value = data.description;
+      document.getElementById('edit-category').value = data.category;
+      document.getElementById('edit-keywords').value = data.keywords;
+      document.getElementById('edit-pub-date').value = data.publication_date;
+      document.getElementById('edit-isbn').value = data.isbn;
+      document.getElementById('edit-modal').classList.add('active');
     }}
 
     function closeEditModal() {{
@@ -3,6 +3,7 @@
 Arabic text normalization & detection helpers (no font hacks).
 
 - has_arabic(text): quick check for Arabic script.
+- count_ascii_letters(text): number of Latin letters (for "mostly Latin" filters).
 - normalize_text(text): remove diacritics/tatweel, normalize punctuation & digits, collapse whitespace, NFC.
 """
 
@@ -28,26 +29,51 @@ _PUNCT_MAP = str.maketrans({
     "ـ": "",   # tatweel
 })
 
+# Diacritics, punctuation (incl. tatweel) and digits folded into one table so
+# normalize_text needs a single translate pass instead of four.
+_COMBINED_TRANSLATE = {
+    **_PUNCT_MAP,
+    **_DIGITS_MAP,
+    **{cp: None for cp in range(0x064B, 0x0656)},
+    0x0670: None,
+}
+
+_WS_RE = re.compile(r"\s+")
+
+# Every ASCII byte that is not a letter, for count_ascii_letters()
+_ASCII_NON_LETTERS = bytes(b for b in range(128) if not chr(b).isalpha())
+
 _ARABIC_BLOCK = (0x0600, 0x06FF)
 
+_ARABIC_RANGES = (
+    (0x0600, 0x06FF),  # Arabic
+    (0x0750, 0x077F),  # Arabic Supplement
+    (0x08A0, 0x08FF),  # Arabic Extended-A
+    (0xFB50, 0xFDFF),  # Arabic Presentation Forms-A
+    (0xFE70, 0xFEFF),  # Arabic Presentation Forms-B
+)
+
+# Single character class over all Arabic ranges; re scans in C and stops at the first hit
+_ARABIC_ANY = re.compile(
+    "[" + "".join(f"{chr(lo)}-{chr(hi)}" for lo, hi in _ARABIC_RANGES) + "]"
+)
+
+_ARABIC_CORE = re.compile(f"[{chr(_ARABIC_BLOCK[0])}-{chr(_ARABIC_BLOCK[1])}]")
+
 def has_arabic(text: str) -> bool:
     """
     True if any char is in Arabic core/supplement/extended or presentation forms.
     Covers codepoints used by many Arabic PDFs.
     """
-    ranges = (
-        (0x0600, 0x06FF),  # Arabic
-        (0x0750, 0x077F),  # Arabic Supplement
-        (0x08A0, 0x08FF),  # Arabic Extended-A
-        (0xFB50, 0xFDFF),  # Arabic Presentation Forms-A
-        (0xFE70, 0xFEFF),  # Arabic Presentation Forms-B
-    )
-    for ch in text:
-        cp = ord(ch)
-        for lo, hi in ranges:
-            if lo <= cp <= hi:
-                return True
-    return False
+    return _ARABIC_ANY.search(text) is not None
+
+def count_arabic(text: str) -> int:
+    """Number of characters in the core Arabic block (U+0600-U+06FF)."""
+    return len(_ARABIC_CORE.findall(text))
+
+def count_ascii_letters(text: str) -> int:
+    """Number of A-Z/a-z characters, counted with C-level encode/translate passes."""
+    return len(text.encode("ascii", "ignore").translate(None, _ASCII_NON_LETTERS))
 
 def strip_diacritics(text: str) -> str:
     return _ARABIC_DIACRITICS.sub("", text)
@@ -59,20 +85,12 @@ def normalize_punct(text: str) -> str:
     return text.translate(_PUNCT_MAP)
 
 def collapse_ws(text: str) -> str:
-    return re.sub(r"\s+", " ", text).strip()
+    return _WS_RE.sub(" ", text).strip()
 
 def normalize_text(text: str) -> str:
     if not text:
         return text
-    # NFC normalize first
-    text = unicodedata.normalize("NFC", text)
-    # remove tatweel explicitly (also covered by punct map)
-    text = text.replace(_TATWEEL, "")
-    # diacritics
-    text = strip_diacritics(text)
-    # punctuation & digits
-    text = normalize_punct(text)
-    text = normalize_digits(text)
+    # NFC first, then diacritics/tatweel/punctuation/digits in one pass
+    text = unicodedata.normalize("NFC", text).translate(_COMBINED_TRANSLATE)
     # collapse whitespace
-    text = collapse_ws(text)
-    return text
+    return _WS_RE.sub(" ", text).strip()
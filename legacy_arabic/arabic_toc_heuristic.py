@@ -14,26 +14,39 @@ When to use
 - Called by TocExtractor AFTER trying:
     1) native bookmarks
     2) TOC page parsing (toc_page_extractor)
+- Use extract_doc() to reuse the fitz.Document already opened for step 2.
 - Works on *digital-text* pages. If pages are image-only, you'll need OCR (V5).
 
 Tunable knobs
 -------------
 - TOP_FRACTION: portion of page height considered "top" (0.40 = top 40%)
+- CLIP_MARGIN: extra page height extracted below the cut (lines straddling it)
 - MIN_SECTIONS: minimum headings to accept before falling back to "Document"
 - MAX_CANDIDATES_PER_PAGE: cap lines per page to avoid noise flood
+- MIN_ARABIC_SHARE: pages whose top strip is less Arabic than this are skipped
+- PARALLEL_MIN_PAGES: page count from which extract() scans pages in a process pool
+- PARALLEL_MAX_WORKERS: upper bound on the pool size
 """
 
 from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Tuple
+import os
 import re
 import fitz  # PyMuPDF
-from ..models.schemas import SectionInfo, SectionsReport
-from .arabic_normalizer import normalize_text
+from app.models.schemas import SectionInfo, SectionsReport
+from .arabic_normalizer import normalize_text, count_arabic, count_ascii_letters
 
 # ---------- Heuristic knobs ----------
 TOP_FRACTION = 0.40             # scan top 40% of each page
+CLIP_MARGIN = 0.05              # extra strip below the cut so lines straddling it stay whole
 MIN_SECTIONS = 2                # if fewer than this are found -> fallback
 MAX_CANDIDATES_PER_PAGE = 25    # safety cap per page
+PROBE_CHARS = 512               # top-strip text sampled before the "dict" pass
+MIN_ARABIC_SHARE = 0.20         # skip pages whose sample is less Arabic than this
+PARALLEL_MIN_PAGES = 200        # below this, a process pool costs more than it saves
+PARALLEL_CHUNK_PAGES = 50       # pages per worker task
+PARALLEL_MAX_WORKERS = 4        # cap on worker processes, each holding its own copy of the PDF
 
 # ---------- Heading patterns ----------
 # Level-1 anchors (after normalization)
@@ -62,6 +75,15 @@ LEVELN_PATTERNS = [
 ]
 LEVELN_RE = re.compile("|".join(LEVELN_PATTERNS))
 
+# Both levels in one pattern: every branch is anchored at the start, and the
+# L1 group is tried first, so one .match() reproduces "L1 wins, else L2".
+LEVEL_RE = re.compile(
+    f"(?P<L1>{'|'.join(LEVEL1_PATTERNS)})|(?P<L2>{'|'.join(LEVELN_PATTERNS)})"
+)
+
+# "dict" without image payloads: only text spans are inspected
+DICT_FLAGS = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+
 # Obvious non-headings: footnotes, URLs, etc.
 NEGATIVE_RE = re.compile(r"^\(\d+\)|https?://|www\.", re.IGNORECASE)
 
@@ -69,15 +91,113 @@ def _arabic_heavy(raw: str) -> bool:
     """Reject lines that are mostly ASCII/Latin (citations/URLs)."""
     if not raw:
         return False
-    ascii_letters = sum(ch.isascii() and ch.isalpha() for ch in raw)
+    ascii_letters = count_ascii_letters(raw)
     return ascii_letters <= max(3, int(len(raw) * 0.4))
 
 def _level_for_line(text_norm: str) -> int | None:
-    if LEVEL1_RE.search(text_norm):
-        return 1
-    if LEVELN_RE.search(text_norm):
-        return 2
-    return None
+    m = LEVEL_RE.match(text_norm)
+    if m is None:
+        return None
+    return 1 if m.lastgroup == "L1" else 2
+
+
+def _page_candidates(page: fitz.Page, page_no: int) -> List[Tuple[int, str, int]]:
+    """Heading candidates (level, title, page_no) from the top strip of one page."""
+    found: List[Tuple[int, str, int]] = []
+    rect = page.rect
+    top_cut = rect.y0 + rect.height * TOP_FRACTION
+    # Only ask MuPDF for the top strip; the y0 checks below still apply the exact cut
+    clip = fitz.Rect(rect.x0, rect.y0, rect.x1, min(rect.y1, top_cut + rect.height * CLIP_MARGIN))
+
+    # One TextPage serves the probe, the "dict" pass and the "blocks" fallback;
+    # same flags as the "blocks" default, so MuPDF parses the page only once
+    tp = page.get_textpage(clip=clip, flags=DICT_FLAGS)
+
+    # Cheap "text" probe: Latin-only strips (copyright, English preface) skip the "dict" pass
+    sample = page.get_text("text", textpage=tp)[:PROBE_CHARS]
+    chars = len("".join(sample.split()))
+    if chars == 0 or count_arabic(sample) < chars * MIN_ARABIC_SHARE:
+        return found
+
+    # Prefer rich structure ("dict"); fallback to "blocks"
+    used = False
+    try:
+        content = page.get_text("dict", textpage=tp)["blocks"]  # list of blocks
+        lines_seen = 0
+        for block in content:
+            for line in block.get("lines", []):
+                if lines_seen >= MAX_CANDIDATES_PER_PAGE:
+                    break
+                # smallest Y among spans in this line
+                y0 = min((s["bbox"][1] for s in line.get("spans", []) if "bbox" in s), default=None)
+                if y0 is None or y0 > top_cut:
+                    continue
+                raw = " ".join(s.get("text", "") for s in line.get("spans", []))
+                raw = raw.strip()
+                if not raw:
+                    continue
+                if NEGATIVE_RE.search(raw):
+                    continue
+                if not _arabic_heavy(raw):
+                    continue
+
+                text_norm = normalize_text(raw)
+                lvl = _level_for_line(text_norm)
+                if lvl:
+                    # Store normalized title for consistency
+                    found.append((lvl, text_norm, page_no))
+                    lines_seen += 1
+        used = True
+    except Exception:
+        used = False
+
+    if not used:
+        # Fallback: coarser blocks API, from the already-built TextPage
+        blocks = page.get_text("blocks", textpage=tp) or []
+        kept = 0
+        for x0, y0, x1, y1, raw, *_ in blocks:
+            if kept >= MAX_CANDIDATES_PER_PAGE:
+                break
+            if y0 > top_cut:
+                continue
+            raw = (raw or "").strip()
+            if not raw:
+                continue
+            if NEGATIVE_RE.search(raw):
+                continue
+            if not _arabic_heavy(raw):
+                continue
+
+            text_norm = normalize_text(raw)
+            lvl = _level_for_line(text_norm)
+            if lvl:
+                found.append((lvl, text_norm, page_no))
+                kept += 1
+
+    return found
+
+
+# ---------- Parallel page scan (large documents) ----------
+_worker_doc: fitz.Document | None = None
+
+def _init_worker(pdf_bytes: bytes) -> None:
+    """Open the PDF once per worker process (each gets its own MuPDF context)."""
+    global _worker_doc
+    _worker_doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+
+def _worker_candidates(start: int, stop: int) -> List[Tuple[int, str, int]]:
+    found: List[Tuple[int, str, int]] = []
+    for page_no, page in enumerate(_worker_doc.pages(start, stop), start=start + 1):
+        found.extend(_page_candidates(page, page_no))
+    return found
+
+def _candidates_parallel(pdf_bytes: bytes, num_pages: int) -> List[Tuple[int, str, int]]:
+    """Scan pages across processes; results are concatenated in page order."""
+    bounds = [(s, min(s + PARALLEL_CHUNK_PAGES, num_pages)) for s in range(0, num_pages, PARALLEL_CHUNK_PAGES)]
+    workers = min(os.cpu_count() or 1, PARALLEL_MAX_WORKERS, len(bounds))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(pdf_bytes,)) as ex:
+        results = ex.map(_worker_candidates, *zip(*bounds))
+        return [c for chunk in results for c in chunk]
 
 
 class ArabicTocHeuristic:
@@ -85,69 +205,22 @@ class ArabicTocHeuristic:
 
     def extract(self, pdf_bytes: bytes) -> SectionsReport:
         doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-        num_pages = doc.page_count
+        try:
+            num_pages = doc.page_count
+            if num_pages < PARALLEL_MIN_PAGES:
+                return self.extract_doc(doc)
+        finally:
+            doc.close()
+        return self._build_report(_candidates_parallel(pdf_bytes, num_pages), num_pages)
 
+    def extract_doc(self, doc: fitz.Document) -> SectionsReport:
+        """Same as extract() on an already-open document (the caller closes it)."""
         candidates: List[Tuple[int, str, int]] = []  # (level, title, page_start)
+        for i, page in enumerate(doc.pages(), start=1):
+            candidates.extend(_page_candidates(page, i))
+        return self._build_report(candidates, doc.page_count)
 
-        for i, page in enumerate(doc, start=1):
-            rect = page.rect
-            top_cut = rect.y0 + rect.height * TOP_FRACTION
-
-            # Prefer rich structure ("dict"); fallback to "blocks"
-            used = False
-            try:
-                content = page.get_text("dict")["blocks"]  # list of blocks
-                lines_seen = 0
-                for block in content:
-                    for line in block.get("lines", []):
-                        if lines_seen >= MAX_CANDIDATES_PER_PAGE:
-                            break
-                        # smallest Y among spans in this line
-                        y0 = min((s["bbox"][1] for s in line.get("spans", []) if "bbox" in s), default=None)
-                        if y0 is None or y0 > top_cut:
-                            continue
-                        raw = " ".join(s.get("text", "") for s in line.get("spans", []))
-                        raw = raw.strip()
-                        if not raw:
-                            continue
-                        if NEGATIVE_RE.search(raw):
-                            continue
-                        if not _arabic_heavy(raw):
-                            continue
-
-                        text_norm = normalize_text(raw)
-                        lvl = _level_for_line(text_norm)
-                        if lvl:
-                            # Store normalized title for consistency
-                            candidates.append((lvl, text_norm, i))
-                            lines_seen += 1
-                used = True
-            except Exception:
-                used = False
-
-            if not used:
-                # Fallback: coarser blocks API
-                blocks = page.get_text("blocks") or []
-                kept = 0
-                for x0, y0, x1, y1, raw, *_ in blocks:
-                    if kept >= MAX_CANDIDATES_PER_PAGE:
-                        break
-                    if y0 > top_cut:
-                        continue
-                    raw = (raw or "").strip()
-                    if not raw:
-                        continue
-                    if NEGATIVE_RE.search(raw):
-                        continue
-                    if not _arabic_heavy(raw):
-                        continue
-
-                    text_norm = normalize_text(raw)
-                    lvl = _level_for_line(text_norm)
-                    if lvl:
-                        candidates.append((lvl, text_norm, i))
-                        kept += 1
-
+    def _build_report(self, candidates: List[Tuple[int, str, int]], num_pages: int) -> SectionsReport:
         # Small cleanups: dedupe consecutive identical titles on same page
         dedup: List[Tuple[int, str, int]] = []
         for c in candidates:
@@ -160,6 +233,20 @@ class ArabicTocHeuristic:
             only = SectionInfo(section_id="1", title="Document", level=1, page_start=1, page_end=num_pages)
             return SectionsReport(bookmarks_found=False, sections=[only])
 
+        # Section ends: one reverse pass tracking, per level, the index of the
+        # nearest following heading at that level (None = none follows).
+        max_level = max(c[0] for c in candidates)
+        next_at_level: List[int | None] = [None] * (max_level + 1)
+        ends: List[int] = [num_pages] * len(candidates)
+        for idx in range(len(candidates) - 1, -1, -1):
+            lvl, _, pstart = candidates[idx]
+            if idx == 0:
+                lvl = 1  # matches the bootstrap below
+            following = [j for j in next_at_level[1:lvl + 1] if j is not None]
+            if following:
+                ends[idx] = max(pstart, candidates[min(following)][2] - 1)
+            next_at_level[candidates[idx][0]] = idx
+
         # Build sections based on next same-or-higher-level heading
         sections: List[SectionInfo] = []
         counters: List[int] = []  # hierarchical counters per level
@@ -169,12 +256,7 @@ class ArabicTocHeuristic:
             if idx == 0 and lvl > 1:
                 lvl = 1
 
-            pend = num_pages
-            for j in range(idx + 1, len(candidates)):
-                lvl_j, _, p_j = candidates[j]
-                if lvl_j <= lvl:
-                    pend = max(pstart, p_j - 1)
-                    break
+            pend = ends[idx]
 
             # Resize counters to current level, then increment current level
             if len(counters) < lvl:
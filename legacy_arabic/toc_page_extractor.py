@@ -11,6 +11,13 @@ Usage:
     from .toc_page_extractor import TocPageExtractor
     report = TocPageExtractor().find_and_parse(pdf_bytes)
     if report: return report
+
+    # Or share one opened document with the heuristic fallback:
+    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    try:
+        report = TocPageExtractor().parse_doc(doc) or ArabicTocHeuristic().extract_doc(doc)
+    finally:
+        doc.close()
 """
 
 
@@ -19,12 +26,13 @@ from typing import List, Optional, Tuple
 import re
 import fitz  # PyMuPDF
 from fastapi import HTTPException
-from ..models.schemas import SectionInfo, SectionsReport
-from .arabic_normalizer import normalize_text, has_arabic
+from app.models.schemas import SectionInfo, SectionsReport
+from .arabic_normalizer import normalize_text, has_arabic, count_ascii_letters
 
 # ---------- Config (tweak as needed) ----------
 MAX_SCAN_PAGES = 12           # Not used when explicit indices provided (kept for clarity)
 MIN_TOC_LINES = 3             # Minimal number of parseable TOC lines to accept a page as TOC
+DENSE_TOC_LINES = MIN_TOC_LINES * 4  # A labeled page with this many lines ends the scan early
 
 # Prefer the known TOC page index (0-based). For many books this is page 5 => index 4.
 PREFERRED_TOC_PAGE_INDEX = 4
@@ -42,6 +50,12 @@ RE_NUM_FIRST = re.compile(r"^\s*([0-9٠-٩۰-۹]{1,4})\s+(.{3,})$")
 # Number-last lines (e.g., "تمهيد السلسلة … 9")
 RE_NUM_LAST  = re.compile(r"^(.{3,}?)\s*[\.·\s…]*\s*([0-9٠-٩۰-۹]{1,4})\s*$")
 
+# Any TOC keyword, found in a single scan of the page text
+_TOC_KEYWORD_RE = re.compile("|".join(re.escape(k) for k in TOC_KEYWORDS))
+
+# Stray numbers at either edge of a title, stripped in one pass
+_EDGE_NUMS = re.compile(r"^[0-9]+\s+|\s+[0-9]+$")
+
 # Negative filters: drop obvious non-headings (footnotes/URLs/citations)
 NEGATIVE_RE = re.compile(r"^\(\d+\)|https?://|www\.", re.IGNORECASE)
 
@@ -49,13 +63,14 @@ def _looks_arabic_heavy(s: str) -> bool:
     """Reject lines that are mostly ASCII/Latin (citations/URLs)."""
     if not s:
         return False
-    ascii_letters = sum(ch.isascii() and ch.isalpha() for ch in s)
+    ascii_letters = count_ascii_letters(s)
     return ascii_letters <= max(3, int(len(s) * 0.4))
 
+# Arabic-Indic and Eastern Arabic-Indic -> Western digits
+_DIGIT_TRANS = str.maketrans("٠١٢٣٤٥٦٧٨٩۰۱۲۳۴۵۶۷۸۹", "01234567890123456789")
+
 def _to_int(nstr: str) -> int:
-    # Arabic-Indic and Eastern Arabic-Indic -> Western digits
-    trans = str.maketrans("٠١٢٣٤٥٦٧٨٩۰۱۲۳۴۵۶۷۸۹", "01234567890123456789")
-    return int(nstr.translate(trans))
+    return int(nstr.translate(_DIGIT_TRANS))
 
 
 class TocPageExtractor:
@@ -78,6 +93,13 @@ class TocPageExtractor:
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Invalid or corrupt PDF: {e}")
 
+        try:
+            return self.parse_doc(doc)
+        finally:
+            doc.close()
+
+    def parse_doc(self, doc: fitz.Document) -> Optional[SectionsReport]:
+        """Same as find_and_parse() on an already-open document (the caller closes it)."""
         num_pages = doc.page_count
         if num_pages <= 0:
             return None
@@ -90,14 +112,17 @@ class TocPageExtractor:
             if not raw_text:
                 continue
 
-            text_norm = normalize_text(raw_text)
+            # normalize_text() collapses newlines, so split first and normalize per line
+            norm_lines = [normalize_text(line) for line in raw_text.splitlines()]
             toc_lines: List[Tuple[int, str]] = []
 
             # Parse each normalized line for number+title pairs
-            for line in text_norm.splitlines():
-                line = line.strip()
+            for line in norm_lines:
                 if len(line) < 3:
                     continue
+                # Every accepted title is Arabic, so Latin-only lines can skip both regexes
+                if not has_arabic(line):
+                    continue
 
                 # number-first pattern
                 m1 = RE_NUM_FIRST.match(line)
@@ -105,8 +130,7 @@ class TocPageExtractor:
                     pnum = _to_int(m1.group(1))
                     title = m1.group(2).strip().strip(".·…")
                     # strip stray numbers at edges
-                    title = re.sub(r"^[0-9]+\s+", "", title)
-                    title = re.sub(r"\s+[0-9]+$", "", title)
+                    title = _EDGE_NUMS.sub("", title)
                     # filters
                     if not (1 <= pnum <= num_pages):
                         continue
@@ -124,8 +148,7 @@ class TocPageExtractor:
                     title = m2.group(1).strip().strip(".·…")
                     pnum = _to_int(m2.group(2))
                     # strip stray numbers at edges
-                    title = re.sub(r"^[0-9]+\s+", "", title)
-                    title = re.sub(r"\s+[0-9]+$", "", title)
+                    title = _EDGE_NUMS.sub("", title)
                     # filters
                     if not (1 <= pnum <= num_pages):
                         continue
@@ -137,10 +160,14 @@ class TocPageExtractor:
                         toc_lines.append((pnum, title))
 
             # Decide if this page is the TOC page
-            if any(k in text_norm for k in TOC_KEYWORDS) or len(toc_lines) >= MIN_TOC_LINES:
+            has_keyword = _TOC_KEYWORD_RE.search("\n".join(norm_lines)) is not None
+            if has_keyword or len(toc_lines) >= MIN_TOC_LINES:
                 # Keep the densest TOC-like page
                 if best is None or len(toc_lines) > len(best[1]):
                     best = (i, toc_lines)
+                # A labeled, dense page is the TOC; skip the remaining candidates
+                if has_keyword and len(toc_lines) >= DENSE_TOC_LINES:
+                    break
 
         if not best:
             return None
@@ -157,9 +184,9 @@ class TocPageExtractor:
         for pnum, title in lines:
             if pnum <= last_p or pnum < 1 or pnum > num_pages:
                 continue
-            # Normalize title for consistent output
-            title_norm = normalize_text(title)
-            entries.append((1, title_norm, pnum))  # level=1 for simplicity/robustness
+            # Titles come from the already-normalized page text; only edge
+            # whitespace left by the dot-leader strip needs trimming
+            entries.append((1, title.strip(), pnum))  # level=1 for simplicity/robustness
             last_p = pnum
 
         if len(entries) < 2:
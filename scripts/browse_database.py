@@ -1,9 +1,17 @@
 """
 Database Browser Script
 Displays all tables, columns, and record counts in the database.
+
+Usage:
+    python scripts/browse_database.py [--pattern REGEX] [--limit N] [--offset M]
+
+On large schemas, --pattern/--limit/--offset restrict the table section (and
+its reflection and counts) to the selected tables.
 """
 
+import argparse
 import os
+import re
 import sys
 from pathlib import Path
 
@@ -13,11 +21,137 @@ sys.stdout.reconfigure(encoding='utf-8')
 # Add parent directory to path to import app modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sqlalchemy import inspect, text
+from sqlalchemy import func, inspect, literal_column, select, table, text, union_all
 from app.models.database import engine, SessionLocal
 
-def browse_database():
-    """Browse all tables in the database and display their structure."""
+def count_records(db, tables):
+    """Exact row counts for all tables in one UNION ALL round-trip.
+
+    Falls back to one COUNT(*) per table if the combined query fails, so a
+    single unreadable table only reports its own error.
+    """
+    counts = {}
+    if not tables:
+        return counts
+
+    # Core constructs quote each table name for the dialect; branches are
+    # labelled by position so names never appear as string literals
+    union = union_all(*(
+        select(literal_column(str(i)).label("t"), func.count().label("c")).select_from(table(name))
+        for i, name in enumerate(tables)
+    ))
+    try:
+        for i, c in db.execute(union):
+            counts[tables[i]] = c
+        return counts
+    except Exception:
+        db.rollback()
+
+    for table_name in tables:
+        try:
+            counts[table_name] = db.execute(select(func.count()).select_from(table(table_name))).scalar()
+        except Exception as e:
+            db.rollback()
+            counts[table_name] = f"Error: {e}"
+    return counts
+
+
+# Text columns are cut to their display width in SQL (SUBSTR works on both
+# PostgreSQL and SQLite), so long titles and names never cross the wire
+SAMPLE_QUERIES = {
+    "books": '''
+        SELECT b.id, SUBSTR(b.title, 1, 40) as title, SUBSTR(a.name, 1, 19) as author,
+               SUBSTR(b.language, 1, 4) as language, b.page_count
+        FROM books b
+        LEFT JOIN authors a ON b.author_id = a.id
+        ORDER BY b.id DESC
+        LIMIT 5
+    ''',
+    "authors": '''
+        SELECT a.id, SUBSTR(a.name, 1, 30) as name, SUBSTR(a.name_en, 1, 20) as name_en,
+               COUNT(b.id) as book_count
+        FROM authors a
+        LEFT JOIN books b ON a.id = b.author_id
+        GROUP BY a.id, a.name, a.name_en
+        ORDER BY book_count DESC
+        LIMIT 5
+    ''',
+    "categories": '''
+        SELECT c.id, SUBSTR(c.name, 1, 30) as name, SUBSTR(c.slug, 1, 20) as slug,
+               COUNT(bc.book_id) as book_count
+        FROM categories c
+        LEFT JOIN book_categories bc ON c.id = bc.category_id
+        GROUP BY c.id, c.name, c.slug
+        ORDER BY book_count DESC
+        LIMIT 10
+    ''',
+    "pages": '''
+        SELECT
+            COUNT(*) as total_pages,
+            SUM(word_count) as total_words,
+            SUM(char_count) as total_chars,
+            AVG(word_count) as avg_words_per_page
+        FROM pages
+    ''',
+    "languages": '''
+        SELECT language, COUNT(*) as count
+        FROM books
+        GROUP BY language
+        ORDER BY count DESC
+    ''',
+}
+
+
+# Table each sample query reads its rows from; empty means no rows to show
+SAMPLE_SOURCES = {
+    "books": "books",
+    "authors": "authors",
+    "categories": "categories",
+    "pages": "pages",
+    "languages": "books",
+}
+
+
+def fetch_samples(db, counts):
+    """Rows for every SAMPLE_QUERIES entry, in one round-trip on PostgreSQL.
+
+    Queries whose source table is known to be empty (from count_records) are
+    not sent at all. The rest become json_agg() columns of a single SELECT.
+    If that fails (or on other backends), the queries run one by one and a
+    failing section gets its exception instead of rows.
+    """
+    samples = {name: [] for name in SAMPLE_QUERIES if counts.get(SAMPLE_SOURCES[name]) == 0}
+    names = [name for name in SAMPLE_QUERIES if name not in samples]
+    if not names:
+        return samples
+
+    if engine.dialect.name == "postgresql":
+        combined = "SELECT " + ", ".join(
+            f"(SELECT json_agg(t) FROM ({SAMPLE_QUERIES[name]}) t)" for name in names
+        )
+        try:
+            row = db.execute(text(combined)).one()
+            # json_agg yields one object per row, keyed by column; NULL means no rows
+            samples.update((name, agg or []) for name, agg in zip(names, row))
+            return samples
+        except Exception:
+            db.rollback()
+
+    for name in names:
+        try:
+            samples[name] = db.execute(text(SAMPLE_QUERIES[name])).mappings().all()
+        except Exception as e:
+            db.rollback()
+            samples[name] = e
+    return samples
+
+
+def browse_database(pattern=None, limit=None, offset=0):
+    """Browse tables in the database and display their structure.
+
+    pattern filters table names (regex search); offset/limit then select a
+    window of the sorted names. Only the selected tables are reflected and counted.
+    """
 
     print("=" * 70)
     print("📊 DATABASE BROWSER - KitabiAI")
@@ -27,30 +161,40 @@ def browse_database():
     inspector = inspect(engine)
 
     # Get all table names
-    tables = inspector.get_table_names()
+    all_tables = inspector.get_table_names()
 
-    print(f"\n📁 Found {len(tables)} tables in database\n")
+    print(f"\n📁 Found {len(all_tables)} tables in database\n")
+
+    tables = sorted(t for t in all_tables if not pattern or re.search(pattern, t))
+    tables = tables[offset:offset + limit if limit is not None else None]
+    if len(tables) < len(all_tables):
+        print(f"🔎 Showing {len(tables)} of them\n")
+
+    # Reflect the selected tables in one bulk query per kind instead of four per table
+    all_columns = inspector.get_multi_columns(filter_names=tables)
+    all_pks = inspector.get_multi_pk_constraint(filter_names=tables)
+    all_fks = inspector.get_multi_foreign_keys(filter_names=tables)
+    all_indexes = inspector.get_multi_indexes(filter_names=tables)
 
     # Create session for counting records
     db = SessionLocal()
 
     total_records = 0
+    counts = count_records(db, tables)
 
-    for table_name in sorted(tables):
+    for table_name in tables:
         print("-" * 70)
         print(f"📋 TABLE: {table_name}")
         print("-" * 70)
 
         # Get columns
-        columns = inspector.get_columns(table_name)
+        key = (None, table_name)  # default schema
+        columns = all_columns.get(key, [])
 
         # Get record count
-        try:
-            result = db.execute(text(f'SELECT COUNT(*) FROM "{table_name}"'))
-            count = result.scalar()
+        count = counts[table_name]
+        if isinstance(count, int):
             total_records += count
-        except Exception as e:
-            count = f"Error: {e}"
 
         print(f"   Records: {count}")
         print(f"   Columns: {len(columns)}")
@@ -60,21 +204,20 @@ def browse_database():
         print("   | # | Column Name          | Type              | Nullable | Default |")
         print("   |---|----------------------|-------------------|----------|---------|")
 
+        # Width.precision specifiers pad and truncate in one formatting pass
         for i, col in enumerate(columns, 1):
-            col_name = col['name'][:20].ljust(20)
-            col_type = str(col['type'])[:17].ljust(17)
             nullable = "Yes" if col.get('nullable', True) else "No"
-            default = str(col.get('default', ''))[:7] if col.get('default') else ''
+            default = str(col.get('default') or '')
 
-            print(f"   | {i:<1} | {col_name} | {col_type} | {nullable:<8} | {default:<7} |")
+            print(f"   | {i:<1} | {col['name']:<20.20} | {str(col['type']):<17.17} | {nullable:<8} | {default:<7.7} |")
 
         # Get primary keys
-        pk = inspector.get_pk_constraint(table_name)
+        pk = all_pks.get(key)
         if pk and pk.get('constrained_columns'):
             print(f"\n   🔑 Primary Key: {', '.join(pk['constrained_columns'])}")
 
         # Get foreign keys
-        fks = inspector.get_foreign_keys(table_name)
+        fks = all_fks.get(key)
         if fks:
             print(f"   🔗 Foreign Keys:")
             for fk in fks:
@@ -84,7 +227,7 @@ def browse_database():
                 print(f"      - {cols} → {ref_table}({ref_cols})")
 
         # Get indexes
-        indexes = inspector.get_indexes(table_name)
+        indexes = all_indexes.get(key)
         if indexes:
             print(f"   📇 Indexes:")
             for idx in indexes:
@@ -108,119 +251,72 @@ def browse_database():
     print("📖 SAMPLE DATA")
     print("=" * 70)
 
+    samples = fetch_samples(db, counts)
+
     # Sample books
     print("\n📚 Recent Books (last 5):")
-    try:
-        result = db.execute(text('''
-            SELECT b.id, b.title, a.name as author, b.language, b.page_count
-            FROM books b
-            LEFT JOIN authors a ON b.author_id = a.id
-            ORDER BY b.id DESC
-            LIMIT 5
-        '''))
-        rows = result.fetchall()
-        if rows:
-            print("   | ID | Title                                    | Author              | Lang | Pages |")
-            print("   |----|------------------------------------------|---------------------|------|-------|")
-            for row in rows:
-                title = (row[1] or '')[:40].ljust(40)
-                author = (row[2] or '')[:19].ljust(19)
-                lang = (row[3] or '')[:4].ljust(4)
-                pages = str(row[4] or 0)
-                print(f"   | {row[0]:<2} | {title} | {author} | {lang} | {pages:<5} |")
-        else:
-            print("   (No books found)")
-    except Exception as e:
-        print(f"   Error: {e}")
+    rows = samples["books"]
+    if isinstance(rows, Exception):
+        print(f"   Error: {rows}")
+    elif rows:
+        print("   | ID | Title                                    | Author              | Lang | Pages |")
+        print("   |----|------------------------------------------|---------------------|------|-------|")
+        for row in rows:
+            print(f"   | {row['id']:<2} | {row['title'] or '':<40.40} | {row['author'] or '':<19.19} | {row['language'] or '':<4.4} | {row['page_count'] or 0:<5} |")
+    else:
+        print("   (No books found)")
 
     # Sample authors
     print("\n👤 Authors:")
-    try:
-        result = db.execute(text('''
-            SELECT a.id, a.name, a.name_en, COUNT(b.id) as book_count
-            FROM authors a
-            LEFT JOIN books b ON a.id = b.author_id
-            GROUP BY a.id, a.name, a.name_en
-            ORDER BY book_count DESC
-            LIMIT 5
-        '''))
-        rows = result.fetchall()
-        if rows:
-            print("   | ID | Name (Arabic)                  | Name (English)       | Books |")
-            print("   |----|--------------------------------|----------------------|-------|")
-            for row in rows:
-                name_ar = (row[1] or '')[:30].ljust(30)
-                name_en = (row[2] or '')[:20].ljust(20)
-                print(f"   | {row[0]:<2} | {name_ar} | {name_en} | {row[3]:<5} |")
-        else:
-            print("   (No authors found)")
-    except Exception as e:
-        print(f"   Error: {e}")
+    rows = samples["authors"]
+    if isinstance(rows, Exception):
+        print(f"   Error: {rows}")
+    elif rows:
+        print("   | ID | Name (Arabic)                  | Name (English)       | Books |")
+        print("   |----|--------------------------------|----------------------|-------|")
+        for row in rows:
+            print(f"   | {row['id']:<2} | {row['name'] or '':<30.30} | {row['name_en'] or '':<20.20} | {row['book_count']:<5} |")
+    else:
+        print("   (No authors found)")
 
     # Sample categories
     print("\n📂 Categories:")
-    try:
-        result = db.execute(text('''
-            SELECT c.id, c.name, c.slug, COUNT(bc.book_id) as book_count
-            FROM categories c
-            LEFT JOIN book_categories bc ON c.id = bc.category_id
-            GROUP BY c.id, c.name, c.slug
-            ORDER BY book_count DESC
-            LIMIT 10
-        '''))
-        rows = result.fetchall()
-        if rows:
-            print("   | ID | Category Name                  | Slug                 | Books |")
-            print("   |----|--------------------------------|----------------------|-------|")
-            for row in rows:
-                name = (row[1] or '')[:30].ljust(30)
-                slug = (row[2] or '')[:20].ljust(20)
-                print(f"   | {row[0]:<2} | {name} | {slug} | {row[3]:<5} |")
-        else:
-            print("   (No categories found)")
-    except Exception as e:
-        print(f"   Error: {e}")
+    rows = samples["categories"]
+    if isinstance(rows, Exception):
+        print(f"   Error: {rows}")
+    elif rows:
+        print("   | ID | Category Name                  | Slug                 | Books |")
+        print("   |----|--------------------------------|----------------------|-------|")
+        for row in rows:
+            print(f"   | {row['id']:<2} | {row['name'] or '':<30.30} | {row['slug'] or '':<20.20} | {row['book_count']:<5} |")
+    else:
+        print("   (No categories found)")
 
     # Pages summary
     print("\n📄 Pages Summary:")
-    try:
-        result = db.execute(text('''
-            SELECT
-                COUNT(*) as total_pages,
-                SUM(word_count) as total_words,
-                SUM(char_count) as total_chars,
-                AVG(word_count) as avg_words_per_page
-            FROM pages
-        '''))
-        row = result.fetchone()
-        if row and row[0]:
-            print(f"   Total Pages: {row[0]:,}")
-            print(f"   Total Words: {row[1]:,}" if row[1] else "   Total Words: N/A")
-            print(f"   Total Characters: {row[2]:,}" if row[2] else "   Total Characters: N/A")
-            print(f"   Avg Words/Page: {row[3]:.1f}" if row[3] else "   Avg Words/Page: N/A")
-        else:
-            print("   (No pages found)")
-    except Exception as e:
-        print(f"   Error: {e}")
+    rows = samples["pages"]
+    if isinstance(rows, Exception):
+        print(f"   Error: {rows}")
+    elif rows and rows[0]['total_pages']:
+        row = rows[0]
+        print(f"   Total Pages: {row['total_pages']:,}")
+        print(f"   Total Words: {row['total_words']:,}" if row['total_words'] else "   Total Words: N/A")
+        print(f"   Total Characters: {row['total_chars']:,}" if row['total_chars'] else "   Total Characters: N/A")
+        print(f"   Avg Words/Page: {row['avg_words_per_page']:.1f}" if row['avg_words_per_page'] else "   Avg Words/Page: N/A")
+    else:
+        print("   (No pages found)")
 
     # Language distribution
     print("\n🌍 Language Distribution:")
-    try:
-        result = db.execute(text('''
-            SELECT language, COUNT(*) as count
-            FROM books
-            GROUP BY language
-            ORDER BY count DESC
-        '''))
-        rows = result.fetchall()
-        if rows:
-            for row in rows:
-                lang = row[0] or 'Unknown'
-                print(f"   - {lang}: {row[1]} books")
-        else:
-            print("   (No data)")
-    except Exception as e:
-        print(f"   Error: {e}")
+    rows = samples["languages"]
+    if isinstance(rows, Exception):
+        print(f"   Error: {rows}")
+    elif rows:
+        for row in rows:
+            lang = row['language'] or 'Unknown'
+            print(f"   - {lang}: {row['count']} books")
+    else:
+        print("   (No data)")
 
     db.close()
 
@@ -230,4 +326,10 @@ def browse_database():
 
 
 if __name__ == "__main__":
-    browse_database()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Browse the KitabiAI database.")
+    parser.add_argument("--pattern", help="only tables whose name matches this regex")
+    parser.add_argument("--limit", type=int, help="show at most this many tables")
+    parser.add_argument("--offset", type=int, default=0, help="skip this many tables first")
+    args = parser.parse_args()
+
+    browse_database(pattern=args.pattern, limit=args.limit, offset=args.offset)
\ No newline at end of file
@@ -9,13 +9,18 @@ This script will:
 DANGER: This will permanently delete ALL data in the database!
 Use with caution - only for development/testing.
 
+With --truncate, the tables are emptied in a single TRUNCATE ... RESTART
+IDENTITY CASCADE statement instead, keeping the schema in place. Use the
+default (--recreate) after schema changes.
+
 Usage:
-    python reset_db.py
+    python reset_db.py [--recreate | --truncate]
 """
 
+import argparse
 import sys
 from app.models.database import Base, engine, SessionLocal
-from sqlalchemy import inspect
+from sqlalchemy import inspect, text
 
 
 def confirm_reset():
@@ -74,6 +79,28 @@ def show_current_stats():
         return True  # Assume data exists
 
 
+def truncate_database():
+    """Empty all tables in one statement, keeping the schema."""
+
+    print("\n🔄 Starting database reset (truncate)...\n")
+
+    table_names = [t.name for t in Base.metadata.sorted_tables]
+    try:
+        print(f"🧹 Truncating {len(table_names)} table(s): {', '.join(table_names)}")
+        with engine.begin() as conn:
+            conn.execute(text(f"TRUNCATE {', '.join(table_names)} RESTART IDENTITY CASCADE"))
+        print("✅ All tables truncated successfully!")
+    except Exception as e:
+        print(f"❌ Error truncating tables: {e}")
+        sys.exit(1)
+
+    print("\n" + "="*70)
+    print("✅ DATABASE RESET COMPLETE!")
+    print("="*70)
+    print("\nYour database is now empty and ready for fresh data.")
+    print("You can now upload books through the web interface.\n")
+
+
 def reset_database():
     """Drop all tables and recreate them."""
 
@@ -122,6 +149,14 @@ def reset_database():
 def main():
     """Main function to orchestrate database reset."""
 
+    parser = argparse.ArgumentParser(description="Reset the KitabiAI database.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--recreate", action="store_true",
+                      help="drop and recreate all tables (default; use after schema changes)")
+    mode.add_argument("--truncate", action="store_true",
+                      help="empty all tables in one TRUNCATE, keeping the schema")
+    args = parser.parse_args()
+
     print("\n" + "="*70)
     print("Database Reset Utility")
     print("="*70)
@@ -141,7 +176,10 @@ def main():
         return
 
     # Perform the reset
-    reset_database()
+    if args.truncate:
+        truncate_database()
+    else:
+        reset_database()
 
 
 if __name__ == "__main__":
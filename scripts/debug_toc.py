@@ -1,106 +1,163 @@
 """
 Debug script to see the actual TOC format from your PDF.
 Run this to see what the TOC lines look like.
+
+Usage:
+    python debug_toc.py [pdf_path ...]   # defaults to ar_1.pdf
 """
 
+import hashlib
+import json
 import re
+import sys
 from pathlib import Path
 from dotenv import load_dotenv
 import os
 from azure.ai.documentintelligence import DocumentIntelligenceClient
 from azure.core.credentials import AzureKeyCredential
 
+# Layout line text is cached here, keyed by the SHA-256 of the PDF bytes.
+# Only the line contents are stored (a list of lines per page): reloading is
+# a single json.loads with no Azure model objects to rebuild.
+CACHE_DIR = Path(".azure_cache")
+
+# TOC header patterns
+TOC_PATTERNS = [
+    r"المحتويات",
+    r"فهرس",
+    r"فهرس\s+المحتويات",
+    r"جدول\s+المحتويات",
+]
+toc_regex = re.compile("|".join(TOC_PATTERNS))
+
+# Candidate TOC line formats, compiled once
+LINE_PATTERNS = {
+    "Original (2+ spaces/dots + digits)": re.compile(r".+[\s\.]{2,}[\u0660-\u0669\d]+$"),
+    "Any whitespace + digits at end": re.compile(r".+\s+[\u0660-\u0669\d]+$"),
+    "Just ends with digits": re.compile(r".+[\u0660-\u0669\d]+$"),
+    "Line with digits anywhere": re.compile(r".*[\u0660-\u0669\d]+.*"),
+}
+
 # Load Azure credentials
 load_dotenv()
 endpoint = os.getenv("AZURE_DOCUMENT_INTELLIGENCE_ENDPOINT")
 key = os.getenv("AZURE_DOCUMENT_INTELLIGENCE_KEY")
 
-client = DocumentIntelligenceClient(
-    endpoint=endpoint,
-    credential=AzureKeyCredential(key)
-)
 
-# Load your PDF
-pdf_path = "ar_1.pdf"  # Change this to your PDF path
+def load_layouts(pdf_paths):
+    """Line texts per page for each PDF path, from the cache or from Azure.
 
-with open(pdf_path, "rb") as f:
-    poller = client.begin_analyze_document(
-        model_id="prebuilt-layout",
-        body=f.read()
-    )
+    All uncached PDFs are submitted before waiting on any poller, so Azure
+    analyzes them concurrently and the wait is roughly the slowest one.
+    """
+    results = {}
+    pending = {}  # pdf_path -> (poller, cache_path)
+    client = None
 
-result = poller.result()
+    for pdf_path in pdf_paths:
+        with open(pdf_path, "rb") as f:
+            pdf_bytes = f.read()
 
-# Extract all text
-all_text = ""
-for page in result.pages:
-    for line in page.lines:
-        all_text += line.content + "\n"
+        # Reuse a previous analysis of the same PDF instead of calling Azure again
+        cache_path = CACHE_DIR / f"{hashlib.sha256(pdf_bytes).hexdigest()}.lines.json"
 
-print(f"Total extracted text length: {len(all_text)} characters")
-print(f"\n{'='*80}\n")
+        if cache_path.exists():
+            print(f"Using cached layout result: {cache_path}")
+            results[pdf_path] = json.loads(cache_path.read_text(encoding="utf-8"))
+            continue
 
-# Find TOC header
-TOC_PATTERNS = [
-    r"المحتويات",
-    r"فهرس",
-    r"فهرس\s+المحتويات",
-    r"جدول\s+المحتويات",
-]
-toc_regex = re.compile("|".join(TOC_PATTERNS))
+        if client is None:
+            client = DocumentIntelligenceClient(
+                endpoint=endpoint,
+                credential=AzureKeyCredential(key)
+            )
+        poller = client.begin_analyze_document(
+            model_id="prebuilt-layout",
+            body=pdf_bytes
+        )
+        pending[pdf_path] = (poller, cache_path)
 
-# Search in beginning
-beginning_text = all_text[:len(all_text)//3]
-toc_match = toc_regex.search(beginning_text)
+    for pdf_path, (poller, cache_path) in pending.items():
+        result = poller.result()
+        page_lines = [[line.content for line in page.lines] for page in result.pages]
+        CACHE_DIR.mkdir(exist_ok=True)
+        cache_path.write_text(json.dumps(page_lines, ensure_ascii=False), encoding="utf-8")
+        results[pdf_path] = page_lines
 
-if toc_match:
-    print(f"✅ Found TOC header: '{toc_match.group()}'")
-    print(f"\n{'='*80}\n")
-    
-    # Get text after header
-    toc_start = toc_match.start()
-    sample_after = beginning_text[toc_start:]
-    
-    # Get first 50 lines after the header
-    lines = sample_after.split("\n")
-    
-    print("First 50 lines after TOC header:")
-    print(f"\n{'='*80}\n")
-    
-    for i, line in enumerate(lines[:50], 1):
-        line = line.strip()
-        if line:
-            print(f"{i:3d}. [{len(line):3d} chars] {line}")
-            
-    print(f"\n{'='*80}\n")
-    print("\nNow let's see which pattern matches:")
+    return results
+
+
+def print_toc_report(page_lines):
+    """Print where the TOC header is and which line formats match after it."""
+    # Extract all text (one join instead of repeated string concatenation)
+    all_text = "".join([line + "\n" for lines in page_lines for line in lines])
+
+    print(f"Total extracted text length: {len(all_text)} characters")
     print(f"\n{'='*80}\n")
-    
-    # Test different patterns
-    patterns = {
-        "Original (2+ spaces/dots + digits)": r".+[\s\.]{2,}[\u0660-\u0669\d]+$",
-        "Any whitespace + digits at end": r".+\s+[\u0660-\u0669\d]+$",
-        "Just ends with digits": r".+[\u0660-\u0669\d]+$",
-        "Line with digits anywhere": r".*[\u0660-\u0669\d]+.*",
-    }
-    
-    for pattern_name, pattern in patterns.items():
-        regex = re.compile(pattern)
-        matches = [line.strip() for line in lines[1:30] if line.strip() and regex.match(line.strip())]
-        print(f"\n{pattern_name}:")
-        print(f"  Matched {len(matches)} lines")
-        if matches:
-            print(f"  Examples:")
-            for match in matches[:3]:
-                print(f"    - {match}")
-else:
-    print("❌ No TOC header found in beginning")
-    print("\nSearching in end of book...")
-    
-    end_text = all_text[int(len(all_text)*0.8):]
-    toc_match = toc_regex.search(end_text)
-    
+
+    # Search in beginning (pos/endpos bound the scan without copying the text)
+    beginning_end = len(all_text)//3
+    toc_match = toc_regex.search(all_text, 0, beginning_end)
+
     if toc_match:
-        print(f"✅ Found TOC header at end: '{toc_match.group()}'")
+        print(f"✅ Found TOC header: '{toc_match.group()}'")
+        print(f"\n{'='*80}\n")
+
+        # Get text after header
+        toc_start = toc_match.start()
+        sample_after = all_text[toc_start:beginning_end]
+
+        # Get first 50 lines after the header (no need to split the rest)
+        lines = sample_after.split("\n", 50)
+
+        print("First 50 lines after TOC header:")
+        print(f"\n{'='*80}\n")
+
+        for i, line in enumerate(lines[:50], 1):
+            line = line.strip()
+            if line:
+                print(f"{i:3d}. [{len(line):3d} chars] {line}")
+
+        print(f"\n{'='*80}\n")
+        print("\nNow let's see which pattern matches:")
+        print(f"\n{'='*80}\n")
+
+        # Test different patterns: one pass over the lines, each stripped once.
+        # Formats overlap, so every pattern is tried on every line.
+        pattern_matches = {name: [] for name in LINE_PATTERNS}
+        for line in lines[1:30]:
+            line = line.strip()
+            if not line:
+                continue
+            for pattern_name, regex in LINE_PATTERNS.items():
+                if regex.match(line):
+                    pattern_matches[pattern_name].append(line)
+
+        for pattern_name, matches in pattern_matches.items():
+            print(f"\n{pattern_name}:")
+            print(f"  Matched {len(matches)} lines")
+            if matches:
+                print(f"  Examples:")
+                for match in matches[:3]:
+                    print(f"    - {match}")
     else:
-        print("❌ No TOC header found anywhere")
\ No newline at end of file
+        print("❌ No TOC header found in beginning")
+        print("\nSearching in end of book...")
+
+        toc_match = toc_regex.search(all_text, int(len(all_text)*0.8))
+
+        if toc_match:
+            print(f"✅ Found TOC header at end: '{toc_match.group()}'")
+        else:
+            print("❌ No TOC header found anywhere")
+
+
+if __name__ == "__main__":
+    # Load your PDFs
+    pdf_paths = sys.argv[1:] or ["ar_1.pdf"]  # Pass PDF paths, or change this default
+
+    layouts = load_layouts(pdf_paths)
+    for pdf_path in pdf_paths:
+        if len(pdf_paths) > 1:
+            print(f"\n{'#'*80}\n# {pdf_path}\n{'#'*80}\n")
+        print_toc_report(layouts[pdf_path])
@@ -27,49 +27,55 @@ with engine.connect() as conn:
         );
     """))
     
-    # Step 2: Migrate existing authors from books table
-    print("Step 2: Migrating authors...")
-    conn.execute(text("""
-        INSERT INTO authors (name, slug)
-        SELECT DISTINCT author, author_slug
-        FROM books
-        WHERE author IS NOT NULL AND author_slug IS NOT NULL
-        ON CONFLICT (name) DO NOTHING;
-    """))
-    
-    # Step 3: Migrate existing categories from books table
-    print("Step 3: Migrating categories...")
-    conn.execute(text("""
-        INSERT INTO categories (name, slug)
-        SELECT DISTINCT category, 
-               LOWER(REPLACE(REPLACE(category, ' ', '-'), '/', '-'))
-        FROM books
-        WHERE category IS NOT NULL
-        ON CONFLICT (name) DO NOTHING;
-    """))
-    
-    # Step 4: Add foreign key columns to books
-    print("Step 4: Adding foreign key columns...")
+    # Step 2: Add foreign key columns to books
+    print("Step 2: Adding foreign key columns...")
     conn.execute(text("""
         ALTER TABLE books 
         ADD COLUMN IF NOT EXISTS author_id INTEGER,
         ADD COLUMN IF NOT EXISTS category_id INTEGER;
     """))
     
-    # Step 5: Populate foreign keys
-    print("Step 5: Populating foreign keys...")
-    conn.execute(text("""
-        UPDATE books 
-        SET author_id = authors.id
-        FROM authors
-        WHERE books.author = authors.name;
-    """))
-    
+    # Steps 3-5: Migrate authors and categories and populate the foreign keys
+    # in one statement. Rows inserted by a CTE are not visible to the rest of
+    # the statement through the table, so each lookup set is the RETURNING
+    # rows plus what the table already held.
+    print("Steps 3-5: Migrating authors and categories, populating foreign keys...")
     conn.execute(text("""
+        WITH new_authors AS (
+            INSERT INTO authors (name, slug)
+            SELECT DISTINCT author, author_slug
+            FROM books
+            WHERE author IS NOT NULL AND author_slug IS NOT NULL
+            ON CONFLICT (name) DO NOTHING
+            RETURNING id, name
+        ),
+        new_categories AS (
+            INSERT INTO categories (name, slug)
+            SELECT DISTINCT category, 
+                   LOWER(REPLACE(REPLACE(category, ' ', '-'), '/', '-'))
+            FROM books
+            WHERE category IS NOT NULL
+            ON CONFLICT (name) DO NOTHING
+            RETURNING id, name
+        ),
+        all_authors AS (
+            SELECT id, name FROM new_authors
+            UNION ALL
+            SELECT id, name FROM authors
+        ),
+        all_categories AS (
+            SELECT id, name FROM new_categories
+            UNION ALL
+            SELECT id, name FROM categories
+        )
         UPDATE books 
-        SET category_id = categories.id
-        FROM categories
-        WHERE books.category = categories.name;
+        SET author_id = COALESCE(a.id, books.author_id),
+            category_id = COALESCE(c.id, books.category_id)
+        FROM books AS src
+        LEFT JOIN all_authors AS a ON a.name = src.author
+        LEFT JOIN all_categories AS c ON c.name = src.category
+        WHERE books.id = src.id
+          AND (a.id IS NOT NULL OR c.id IS NOT NULL);
     """))
     
     # Step 6: Drop old columns (optional - uncomment when ready)
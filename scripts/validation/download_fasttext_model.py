@@ -1,9 +1,52 @@
 #!/usr/bin/env python3
 """Download FastText language identification model."""
 
+import asyncio
+import hashlib
 import os
+import shutil
 import sys
+from itertools import chain
 from pathlib import Path
+from urllib.parse import urlparse
+
+# SHA-256 of the published lid.176.ftz (compressed model, 938,013 bytes)
+MODEL_SHA256 = "8f3472cfe8738a7b6099e8e999c3cbfae0dcd15696aac7d7738a8039db603e83"
+CHUNK_SIZE = 1024 * 1024
+
+# First four bytes of a FastText model (int32 0x2F4F16BA, little-endian)
+FASTTEXT_MAGIC = b'\xba\x16\x4f\x2f'
+# Plausible size window for lid.176.ftz; anything else is an error page or the wrong file
+MIN_MODEL_SIZE, MAX_MODEL_SIZE = 500_000, 5_000_000
+
+# Optional extra mirrors (space-separated URLs) raced against the official CDN
+MIRROR_URLS = os.environ.get("FASTTEXT_MODEL_MIRRORS", "").split()
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+
+def file_sha256(path: Path) -> str:
+    """Hash a file in fixed-size chunks so memory stays constant."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def verify_model(output_path: Path) -> None:
+    """Raise and remove the file if it does not match the pinned digest."""
+    digest = file_sha256(output_path)
+    if digest != MODEL_SHA256:
+        output_path.unlink()
+        raise Exception(f"Checksum mismatch: got {digest[:16]}..., expected {MODEL_SHA256[:16]}...")
+
+
+def check_magic(first_chunk: bytes) -> None:
+    """Reject HTML/gzip error pages before any bytes are written to disk."""
+    if not first_chunk.startswith(FASTTEXT_MAGIC):
+        raise Exception(f"Not a FastText model (starts with {first_chunk[:8]!r})")
+
 
 def download_model():
     """Download FastText lid.176.ftz model."""
@@ -11,8 +54,8 @@ def download_model():
     # Use current directory for output
     output_path = Path("lid.176.ftz")
 
-    # Remove failed download if exists
-    if output_path.exists() and output_path.stat().st_size < 100000:
+    # Remove failed or corrupted download if exists
+    if output_path.exists() and file_sha256(output_path) != MODEL_SHA256:
         output_path.unlink()
         print("Removed incomplete download")
 
@@ -31,6 +74,7 @@ def download_model():
 
     # Try multiple methods
     methods = [
+        ("httpx (mirror race, resumable)", download_with_httpx),
         ("requests library", download_with_requests),
         ("urllib", download_with_urllib),
     ]
@@ -61,14 +105,84 @@ def download_model():
     return False
 
 
+def _part_path(url: str, output_path: Path) -> Path:
+    """Per-mirror partial file, stable across runs so downloads can resume."""
+    return output_path.with_name(f"{output_path.name}.{urlparse(url).hostname}.part")
+
+
+async def _stream_to_part(client, url: str, output_path: Path) -> bool:
+    """Stream one mirror into its .part file, resuming with a Range request."""
+    part = _part_path(url, output_path)
+    offset = part.stat().st_size if part.exists() else 0
+    headers = {'Range': f'bytes={offset}-'} if offset else {}
+
+    async with client.stream("GET", url, headers=headers) as response:
+        # 416: the partial file already holds the whole body
+        if response.status_code != 416:
+            response.raise_for_status()
+            mode = 'ab' if response.status_code == 206 else 'wb'
+            chunks = response.aiter_bytes(CHUNK_SIZE)
+            first = await anext(chunks, b'')
+            if mode == 'wb':
+                check_magic(first)
+            with open(part, mode) as f:
+                f.write(first)
+                async for chunk in chunks:
+                    f.write(chunk)
+
+    verify_model(part)
+    os.replace(part, output_path)
+    return True
+
+
+async def _race_mirrors(urls: list, output_path: Path) -> bool:
+    """Download from all mirrors at once; the first verified copy wins."""
+    import httpx
+
+    errors = []
+    async with httpx.AsyncClient(headers={'User-Agent': USER_AGENT}, timeout=60, follow_redirects=True) as client:
+        pending = {asyncio.create_task(_stream_to_part(client, u, output_path)) for u in urls}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return True
+                    errors.append(task.exception())
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    raise Exception("; ".join(str(e) for e in errors))
+
+
+def download_with_httpx(url: str, output_path: Path) -> bool:
+    """Race the official URL against any configured mirrors (resumable)."""
+    urls = [url] + [u for u in MIRROR_URLS if u != url]
+    try:
+        return asyncio.run(_race_mirrors(urls, output_path))
+    finally:
+        if output_path.exists():
+            for part in output_path.parent.glob(f"{output_path.name}.*.part"):
+                part.unlink()
+
+
 def download_with_requests(url: str, output_path: Path) -> bool:
     """Download using requests library."""
     import requests
 
     headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        'User-Agent': USER_AGENT
     }
 
+    # Check the advertised size before spending bandwidth on the body
+    head = requests.head(url, headers=headers, timeout=30, allow_redirects=True)
+    head.raise_for_status()
+    advertised = int(head.headers.get('content-length', 0))
+    if advertised and not MIN_MODEL_SIZE < advertised < MAX_MODEL_SIZE:
+        raise Exception(f"Unexpected content-length: {advertised:,} bytes")
+
     response = requests.get(url, headers=headers, timeout=60, allow_redirects=True, stream=True)
     response.raise_for_status()
 
@@ -76,8 +190,12 @@ def download_with_requests(url: str, output_path: Path) -> bool:
     total_size = int(response.headers.get('content-length', 0))
     downloaded = 0
 
+    chunks = response.iter_content(chunk_size=CHUNK_SIZE)
+    first = next(chunks, b'')
+    check_magic(first)
+
     with open(output_path, 'wb') as f:
-        for chunk in response.iter_content(chunk_size=8192):
+        for chunk in chain([first], chunks):
             if chunk:
                 f.write(chunk)
                 downloaded += len(chunk)
@@ -87,11 +205,7 @@ def download_with_requests(url: str, output_path: Path) -> bool:
 
     print()  # New line after progress
 
-    # Verify size
-    if output_path.stat().st_size < 100000:
-        output_path.unlink()
-        raise Exception(f"File too small: {output_path.stat().st_size} bytes")
-
+    verify_model(output_path)
     return True
 
 
@@ -101,18 +215,14 @@ def download_with_urllib(url: str, output_path: Path) -> bool:
 
     req = urllib.request.Request(
         url,
-        headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+        headers={'User-Agent': USER_AGENT}
     )
 
-    with urllib.request.urlopen(req, timeout=60) as response:
-        data = response.read()
-
-        if len(data) < 100000:
-            raise Exception(f"File too small: {len(data)} bytes")
-
-        with open(output_path, 'wb') as f:
-            f.write(data)
+    # Stream straight to disk instead of buffering the whole body in memory
+    with urllib.request.urlopen(req, timeout=60) as response, open(output_path, 'wb') as f:
+        shutil.copyfileobj(response, f, CHUNK_SIZE)
 
+    verify_model(output_path)
     return True
 
 
@@ -0,0 +1,132 @@
+"""
+Helpers shared by the language-detection validation scripts.
+
+validate_language_detection.py and validate_language_detection_fasttext.py
+differ only in the proposed detector; the Arabic character count, the cached
+reference (Azure) detection, PDF discovery and the parallel test runner live
+here so both scripts stay in step.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Reference (Azure) results are cached here, keyed by the SHA-256 of the PDF
+# bytes plus the settings that decide the verdict, so re-runs skip Azure
+CACHE_DIR = Path(".azure_cache")
+
+# PDFs listed and tested when main() searches the default directories
+MAX_LISTED = 10
+MAX_TESTS = 5
+
+# Same blocks as legacy_arabic/arabic_normalizer.py: garbled PyMuPDF output
+# often lands in the presentation forms rather than the core block
+ARABIC_RANGES = (
+    (0x0600, 0x06FF),  # Arabic
+    (0x0750, 0x077F),  # Arabic Supplement
+    (0x08A0, 0x08FF),  # Arabic Extended-A
+    (0xFB50, 0xFDFF),  # Arabic Presentation Forms-A
+    (0xFE70, 0xFEFF),  # Arabic Presentation Forms-B
+)
+
+
+def arabic_count(text: str) -> int:
+    """Number of characters in any Arabic block (see ARABIC_RANGES).
+
+    Compares the codepoints as one NumPy array instead of building a list
+    of every matching character with re.findall().
+    """
+    cps = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    return sum(int(np.count_nonzero((cps >= lo) & (cps <= hi))) for lo, hi in ARABIC_RANGES)
+
+
+def reference_detect(detector, pdf_bytes: bytes, settings) -> tuple[str, str]:
+    """(language, text) from the production LanguageDetector, cached on disk."""
+    strategy = "fasttext" if settings.USE_FASTTEXT_DETECTION else "legacy"
+    cache_path = CACHE_DIR / (
+        f"{hashlib.sha256(pdf_bytes).hexdigest()}"
+        f".language-{strategy}-{settings.ARABIC_RATIO_THRESHOLD}.json"
+    )
+    if cache_path.exists():
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+            language, text = cached["language"], cached["text"]
+        except (OSError, ValueError, KeyError, TypeError):
+            # Truncated or hand-edited entry: treat as a miss and rewrite it
+            print(f"   Ignoring corrupt cache entry: {cache_path}")
+        else:
+            print(f"   Using cached result: {cache_path}")
+            return language, text
+
+    language, text, _ = detector.detect(pdf_bytes)
+    CACHE_DIR.mkdir(exist_ok=True)
+    # Written to a temp file in the same directory and renamed into place, so
+    # an interrupted run or a parallel worker never sees a partial entry
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"language": language, "text": text}, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return language, text
+
+
+def iter_pdfs(dirs):
+    """Yield the *.pdf files of each existing directory, lazily.
+
+    Same files as Path.glob("*.pdf") (not recursive), but stops reading
+    directory entries once the caller stops iterating.
+    """
+    for d in dirs:
+        if not d.exists():
+            continue
+        with os.scandir(d) as entries:
+            for entry in entries:
+                if entry.name.endswith(".pdf") and entry.is_file():
+                    yield Path(entry.path)
+
+
+def _run_test_pdf(test_pdf, pdf_path: str):
+    """Run test_pdf() in a worker process, capturing its report.
+
+    Returns (report, result, error); error is None when the test ran.
+    """
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            result = test_pdf(pdf_path)
+    except Exception as e:
+        return buf.getvalue(), None, str(e)
+    return buf.getvalue(), result, None
+
+
+def run_tests(test_pdf, paths: list[str]) -> list:
+    """Run test_pdf() on each path in parallel and return the results.
+
+    Reports are printed in the original order; failed PDFs are logged and
+    left out of the results.
+    """
+    results = []
+    workers = min(len(paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        for pdf, (report, result, error) in zip(paths, ex.map(partial(_run_test_pdf, test_pdf), paths)):
+            sys.stdout.write(report)
+            if error is None:
+                results.append(result)
+            else:
+                logger.error(f"Error testing {pdf}: {error}")
+    return results
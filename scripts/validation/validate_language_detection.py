@@ -9,22 +9,39 @@ This script compares two approaches:
 The key question: Can we detect Arabic even when PyMuPDF produces garbled text?
 """
 
-import re
 import sys
 import logging
+from itertools import islice
 import fitz  # PyMuPDF
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Optional
 
 # Add project root to path (scripts/validation -> root)
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from app.services.detection.language_detector import LanguageDetector
 from app.core.config import settings
+from language_validation_common import (
+    MAX_LISTED,
+    MAX_TESTS,
+    arabic_count,
+    iter_pdfs,
+    reference_detect,
+    run_tests,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Stop sampling pages once this many characters are in and the Arabic
+# ratio is at least this far from the threshold - more pages won't flip it
+EARLY_EXIT_MIN_CHARS = 500
+EARLY_EXIT_MARGIN = 0.25
+
+# Hard limits on the sample, whichever is hit first
+SAMPLE_MAX_PAGES = 10
+SAMPLE_MAX_CHARS = 32 * 1024
+
 
 class QuickLanguageDetector:
     """
@@ -35,7 +52,7 @@ class QuickLanguageDetector:
     def __init__(self, arabic_threshold: float = 0.3):
         self.arabic_threshold = arabic_threshold
 
-    def detect(self, pdf_bytes: bytes) -> Literal["arabic", "english"]:
+    def detect(self, pdf_bytes: bytes) -> tuple[Literal["arabic", "english"], Optional[str]]:
         """
         Detect language using PyMuPDF extraction + character ratio.
 
@@ -45,33 +62,45 @@ class QuickLanguageDetector:
         3. Return language based on threshold
 
         Even if Arabic text is garbled, the Arabic Unicode characters
-        (U+0600-U+06FF) should still be present.
+        (core block or presentation forms) should still be present.
+
+        Returns:
+            Tuple of (language, sample_text)
         """
         try:
-            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-            sample_pages = min(10, doc.page_count)
-
-            sample_text = ""
-            for i in range(sample_pages):
-                page = doc[i]
-                sample_text += page.get_text("text")
-
-            doc.close()
+            with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+                sample_pages = min(SAMPLE_MAX_PAGES, doc.page_count)
+
+                parts = []
+                arabic_chars = total_chars = 0
+                for i in range(sample_pages):
+                    page_text = doc.load_page(i).get_text("text")
+                    parts.append(page_text)
+                    arabic_chars += arabic_count(page_text)
+                    total_chars += len(page_text)
+                    if (total_chars >= EARLY_EXIT_MIN_CHARS and
+                            abs(arabic_chars / total_chars - self.arabic_threshold) > EARLY_EXIT_MARGIN):
+                        break
+                    if total_chars >= SAMPLE_MAX_CHARS:
+                        logger.info(f"QuickDetect: sample capped at {total_chars} chars after {i + 1} pages")
+                        break
+
+            sample_text = "".join(parts)
 
             arabic_ratio = self.get_arabic_ratio(sample_text)
             language = "arabic" if arabic_ratio > self.arabic_threshold else "english"
 
             logger.info(f"QuickDetect: {language} (ratio: {arabic_ratio:.2%}, chars: {len(sample_text)})")
 
-            return language
+            return language, sample_text
 
         except Exception as e:
             logger.error(f"Quick detection failed: {e}")
-            return "english"  # Safe fallback
+            return "english", None  # Safe fallback
 
     def get_arabic_ratio(self, text: str) -> float:
-        """Calculate ratio of Arabic characters (U+0600-U+06FF) in text."""
-        arabic_chars = len(re.findall(r'[\u0600-\u06FF]', text))
+        """Calculate ratio of Arabic characters (any Arabic block) in text."""
+        arabic_chars = arabic_count(text)
         total_chars = max(len(text.strip()), 1)
         return arabic_chars / total_chars
 
@@ -95,7 +124,7 @@ def test_pdf(pdf_path: str):
     azure_detector = LanguageDetector()
 
     try:
-        azure_lang, azure_text = azure_detector.detect(pdf_bytes)
+        azure_lang, azure_text = reference_detect(azure_detector, pdf_bytes, settings)
         print(f"✅ Result: {azure_lang.upper()}")
         print(f"   Text extracted: {len(azure_text)} chars")
         print(f"   Arabic ratio: {azure_detector.get_arabic_ratio(azure_text):.2%}")
@@ -118,20 +147,17 @@ def test_pdf(pdf_path: str):
     )
 
     try:
-        quick_lang = quick_detector.detect(pdf_bytes)
+        quick_lang, pymupdf_text = quick_detector.detect(pdf_bytes)
         print(f"✅ Result: {quick_lang.upper()}")
 
-        # Show what PyMuPDF actually extracts
-        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-        pymupdf_text = doc[0].get_text("text") if doc.page_count > 0 else ""
-        doc.close()
+        # Show what PyMuPDF actually extracted for the detector
+        if pymupdf_text:
+            print(f"   Text extracted: {len(pymupdf_text)} chars")
+            print(f"   Arabic ratio: {quick_detector.get_arabic_ratio(pymupdf_text):.2%}")
 
-        print(f"   Text extracted: {len(pymupdf_text)} chars")
-        print(f"   Arabic ratio: {quick_detector.get_arabic_ratio(pymupdf_text):.2%}")
-
-        # Show sample of PyMuPDF text
-        sample = pymupdf_text[:200].replace('\n', ' ')
-        print(f"   Sample: {sample}...")
+            # Show sample of PyMuPDF text
+            sample = pymupdf_text[:200].replace('\n', ' ')
+            print(f"   Sample: {sample}...")
 
     except Exception as e:
         print(f"❌ Quick detection failed: {e}")
@@ -206,11 +232,8 @@ def main():
         Path("/home/user/KitabiAI"),
     ]
 
-    pdf_files = []
-    for test_dir in test_dirs:
-        if test_dir.exists():
-            pdfs = list(test_dir.glob("*.pdf"))
-            pdf_files.extend(pdfs)
+    # Only as many files as are listed below (plus one to know if there are more)
+    pdf_files = list(islice(iter_pdfs(test_dirs), MAX_LISTED + 1))
 
     if not pdf_files:
         print("\n⚠️  No PDF files found in:")
@@ -220,27 +243,26 @@ def main():
         print("   python validate_language_detection.py <path-to-pdf>")
         return
 
-    print(f"\nFound {len(pdf_files)} PDF file(s):")
-    for pdf in pdf_files[:10]:  # Show first 10
+    if len(pdf_files) > MAX_LISTED:
+        print(f"\nFound more than {MAX_LISTED} PDF files:")
+    else:
+        print(f"\nFound {len(pdf_files)} PDF file(s):")
+    for pdf in pdf_files[:MAX_LISTED]:
         print(f"   - {pdf}")
 
-    if len(pdf_files) > 10:
-        print(f"   ... and {len(pdf_files) - 10} more")
+    if len(pdf_files) > MAX_LISTED:
+        print("   ... and more")
 
     # Test each PDF
     print("\n" + "="*80)
     print("RUNNING TESTS")
     print("="*80)
 
-    results = []
-    max_tests = min(5, len(pdf_files))  # Test first 5 PDFs
+    max_tests = min(MAX_TESTS, len(pdf_files))
+    paths = [str(pdf) for pdf in pdf_files[:max_tests]]
 
-    for pdf in pdf_files[:max_tests]:
-        try:
-            result = test_pdf(str(pdf))
-            results.append(result)
-        except Exception as e:
-            logger.error(f"Error testing {pdf}: {e}")
+    # PDFs are tested in parallel; reports are printed in the original order
+    results = run_tests(test_pdf, paths)
 
     # Summary
     print("\n" + "="*80)
@@ -9,10 +9,11 @@ This script compares two approaches:
 The key question: Can FastText detect Arabic even when PyMuPDF produces garbled text?
 """
 
-import re
 import sys
 import logging
+from itertools import islice
 import fitz  # PyMuPDF
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal, Optional
 
@@ -21,10 +22,47 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from app.services.detection.language_detector import LanguageDetector
 from app.core.config import settings
+from language_validation_common import (
+    MAX_LISTED,
+    MAX_TESTS,
+    arabic_count,
+    iter_pdfs,
+    reference_detect,
+    run_tests,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# FastText only sees this many characters of the whitespace-collapsed sample
+FASTTEXT_SAMPLE_CHARS = 1000
+
+# Hard limit on sampled pages besides the character budget above
+SAMPLE_MAX_PAGES = 10
+
+
+@lru_cache(maxsize=None)
+def _load_fasttext_model(model_path: str):
+    """Load a FastText model once per path; test_pdf() builds a new detector per PDF."""
+    try:
+        import fasttext
+        logger.info(f"Loading FastText model from: {model_path}")
+
+        # Suppress FastText warnings
+        fasttext.FastText.eprint = lambda x: None
+
+        model = fasttext.load_model(model_path)
+        logger.info("✅ FastText model loaded successfully")
+        return model
+    except ImportError:
+        logger.error("❌ FastText not installed. Install with: pip install fasttext-wheel")
+        raise
+    except Exception as e:
+        logger.error(f"❌ Failed to load FastText model: {e}")
+        logger.error(f"   Make sure {model_path} exists in current directory")
+        logger.error(f"   Download from: https://dl.fbaipublicfiles.com/fasttext/supervised-models/lid.176.ftz")
+        raise
+
 
 class FastTextLanguageDetector:
     """
@@ -43,25 +81,9 @@ class FastTextLanguageDetector:
         self._model = None
 
     def _load_model(self):
-        """Lazy load FastText model."""
+        """Lazy load FastText model (shared by every detector in the process)."""
         if self._model is None:
-            try:
-                import fasttext
-                logger.info(f"Loading FastText model from: {self.model_path}")
-
-                # Suppress FastText warnings
-                fasttext.FastText.eprint = lambda x: None
-
-                self._model = fasttext.load_model(self.model_path)
-                logger.info("✅ FastText model loaded successfully")
-            except ImportError:
-                logger.error("❌ FastText not installed. Install with: pip install fasttext-wheel")
-                raise
-            except Exception as e:
-                logger.error(f"❌ Failed to load FastText model: {e}")
-                logger.error(f"   Make sure {self.model_path} exists in current directory")
-                logger.error(f"   Download from: https://dl.fbaipublicfiles.com/fasttext/supervised-models/lid.176.ftz")
-                raise
+            self._model = _load_fasttext_model(self.model_path)
 
     def detect(self, pdf_bytes: bytes) -> tuple[Literal["arabic", "english"], Optional[str]]:
         """
@@ -81,15 +103,22 @@ class FastTextLanguageDetector:
         self._load_model()
 
         try:
-            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-            sample_pages = min(10, doc.page_count)
-
-            sample_text = ""
-            for i in range(sample_pages):
-                page = doc[i]
-                sample_text += page.get_text("text") + "\n"
-
-            doc.close()
+            with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+                sample_pages = min(SAMPLE_MAX_PAGES, doc.page_count)
+
+                # Stop once the collapsed text (words joined by single spaces)
+                # fills the FastText sample; later pages would be cut off anyway
+                parts = []
+                clean_chars = 0
+                for i in range(sample_pages):
+                    page_text = doc.load_page(i).get_text("text")
+                    parts.append(page_text + "\n")
+                    words = page_text.split()
+                    clean_chars += sum(map(len, words)) + len(words)
+                    if clean_chars > FASTTEXT_SAMPLE_CHARS:
+                        break
+
+            sample_text = "".join(parts)
 
             if not sample_text.strip():
                 logger.warning("No text extracted, assuming English")
@@ -101,7 +130,7 @@ class FastTextLanguageDetector:
 
             # FastText expects text without newlines for best results
             # Take first 1000 chars for quick detection
-            text_sample = clean_text[:1000]
+            text_sample = clean_text[:FASTTEXT_SAMPLE_CHARS]
 
             # Predict language (returns tuple of labels and probabilities)
             predictions = self._model.predict(text_sample, k=1)
@@ -133,7 +162,7 @@ class FastTextLanguageDetector:
 
     def get_arabic_ratio(self, text: str) -> float:
         """Calculate ratio of Arabic characters (for comparison with old method)."""
-        arabic_chars = len(re.findall(r'[\u0600-\u06FF]', text))
+        arabic_chars = arabic_count(text)
         total_chars = max(len(text.strip()), 1)
         return arabic_chars / total_chars
 
@@ -157,10 +186,12 @@ def test_pdf(pdf_path: str):
     azure_detector = LanguageDetector()
 
     try:
-        azure_lang, azure_text = azure_detector.detect(pdf_bytes)
+        azure_lang, azure_text = reference_detect(azure_detector, pdf_bytes, settings)
         print(f"✅ Result: {azure_lang.upper()}")
+        # Ratios are computed once here and reused in the comparison below
+        azure_ratio = azure_detector.get_arabic_ratio(azure_text)
         print(f"   Text extracted: {len(azure_text):,} chars")
-        print(f"   Arabic ratio: {azure_detector.get_arabic_ratio(azure_text):.2%}")
+        print(f"   Arabic ratio: {azure_ratio:.2%}")
 
         # Show sample of extracted text
         sample = azure_text[:200].replace('\n', ' ')
@@ -170,6 +201,7 @@ def test_pdf(pdf_path: str):
         print(f"❌ Azure failed: {e}")
         azure_lang = None
         azure_text = None
+        azure_ratio = None
 
     # Method 2: Proposed approach (PyMuPDF + FastText)
     print("\n[Method 2] Proposed: PyMuPDF + FastText")
@@ -181,9 +213,11 @@ def test_pdf(pdf_path: str):
 
         print(f"✅ Result: {fasttext_lang.upper()}")
 
+        fasttext_ratio = None
         if fasttext_text:
+            fasttext_ratio = fasttext_detector.get_arabic_ratio(fasttext_text)
             print(f"   Text extracted: {len(fasttext_text):,} chars")
-            print(f"   Arabic ratio: {fasttext_detector.get_arabic_ratio(fasttext_text):.2%}")
+            print(f"   Arabic ratio: {fasttext_ratio:.2%}")
 
             # Show sample of PyMuPDF text
             sample = fasttext_text[:200].replace('\n', ' ')
@@ -193,6 +227,7 @@ def test_pdf(pdf_path: str):
         print(f"❌ FastText detection failed: {e}")
         fasttext_lang = None
         fasttext_text = None
+        fasttext_ratio = None
 
     # Comparison
     print("\n[Comparison]")
@@ -205,8 +240,6 @@ def test_pdf(pdf_path: str):
 
             # Additional comparison
             if azure_text and fasttext_text:
-                azure_ratio = azure_detector.get_arabic_ratio(azure_text)
-                fasttext_ratio = fasttext_detector.get_arabic_ratio(fasttext_text)
                 ratio_diff = abs(azure_ratio - fasttext_ratio)
 
                 print(f"\n   Arabic ratio comparison:")
@@ -222,8 +255,8 @@ def test_pdf(pdf_path: str):
 
             # Show why they differ
             if azure_text and fasttext_text:
-                print(f"\n   Azure Arabic ratio:    {azure_detector.get_arabic_ratio(azure_text):.2%}")
-                print(f"   PyMuPDF Arabic ratio:  {fasttext_detector.get_arabic_ratio(fasttext_text):.2%}")
+                print(f"\n   Azure Arabic ratio:    {azure_ratio:.2%}")
+                print(f"   PyMuPDF Arabic ratio:  {fasttext_ratio:.2%}")
 
     else:
         print("⚠️  Cannot compare - one method failed")
@@ -296,11 +329,8 @@ def main():
         Path("."),
     ]
 
-    pdf_files = []
-    for test_dir in test_dirs:
-        if test_dir.exists():
-            pdfs = list(test_dir.glob("*.pdf"))
-            pdf_files.extend(pdfs)
+    # Only as many files as are listed below (plus one to know if there are more)
+    pdf_files = list(islice(iter_pdfs(test_dirs), MAX_LISTED + 1))
 
     if not pdf_files:
         print("\n⚠️  No PDF files found in:")
@@ -310,27 +340,26 @@ def main():
         print("   python validate_language_detection_fasttext.py <path-to-pdf>")
         return
 
-    print(f"\nFound {len(pdf_files)} PDF file(s):")
-    for pdf in pdf_files[:10]:  # Show first 10
+    if len(pdf_files) > MAX_LISTED:
+        print(f"\nFound more than {MAX_LISTED} PDF files:")
+    else:
+        print(f"\nFound {len(pdf_files)} PDF file(s):")
+    for pdf in pdf_files[:MAX_LISTED]:
         print(f"   - {pdf}")
 
-    if len(pdf_files) > 10:
-        print(f"   ... and {len(pdf_files) - 10} more")
+    if len(pdf_files) > MAX_LISTED:
+        print("   ... and more")
 
     # Test each PDF
     print("\n" + "="*80)
     print("RUNNING TESTS")
     print("="*80)
 
-    results = []
-    max_tests = min(5, len(pdf_files))  # Test first 5 PDFs
+    max_tests = min(MAX_TESTS, len(pdf_files))
+    paths = [str(pdf) for pdf in pdf_files[:max_tests]]
 
-    for pdf in pdf_files[:max_tests]:
-        try:
-            result = test_pdf(str(pdf))
-            results.append(result)
-        except Exception as e:
-            logger.error(f"Error testing {pdf}: {e}")
+    # PDFs are tested in parallel; reports are printed in the original order
+    results = run_tests(test_pdf, paths)
 
     # Summary
     print("\n" + "="*80)
@@ -0,0 +1,7 @@
+"""Shared pytest configuration for the test suite."""
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "integration: needs the full FastAPI app (settings, database); deselect with -m 'not integration'"
+    )
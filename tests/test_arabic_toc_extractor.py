@@ -10,22 +10,24 @@ from fastapi.testclient import TestClient
 from app.services.extraction.arabic_toc_extractor import ArabicTocExtractor
 
 
+@pytest.fixture(scope="class")
+def extractor():
+    """One extractor shared by the whole class - it holds no per-call state"""
+    return ArabicTocExtractor()
+
+
 class TestArabicTocExtractor:
     """Test suite for Arabic TOC extraction functionality"""
     
-    def setup_method(self):
-        """Run before each test - creates a fresh extractor instance"""
-        self.extractor = ArabicTocExtractor()
-    
     # TEST 1: Check that the extractor initializes correctly
-    def test_extractor_initialization(self):
+    def test_extractor_initialization(self, extractor):
         """Verify the extractor object is created with correct properties"""
-        assert self.extractor is not None
-        assert self.extractor.toc_regex is not None
+        assert extractor is not None
+        assert extractor.toc_regex is not None
         print("✅ Extractor initialized successfully")
     
     # TEST 2: Check TOC pattern detection
-    def test_toc_header_detection(self):
+    def test_toc_header_detection(self, extractor):
         """Verify Arabic TOC headers are correctly identified"""
         # Sample text with Arabic TOC header
         text_with_toc = """
@@ -35,15 +37,15 @@ class TestArabicTocExtractor:
         """
         
         # Check if TOC header is found
-        match = self.extractor.toc_regex.search(text_with_toc)
+        match = extractor.toc_regex.search(text_with_toc)
         assert match is not None
         assert "المحتويات" in match.group()
         print("✅ TOC header detected correctly")
     
     # TEST 3: Check fallback behavior when no TOC found
-    def test_fallback_section(self):
+    def test_fallback_section(self, extractor):
         """Verify fallback section is created when TOC extraction fails"""
-        result = self.extractor._fallback_section()
+        result = extractor._fallback_section()
         
         # Verify the fallback structure
         assert result.bookmarks_found == False
@@ -53,7 +55,7 @@ class TestArabicTocExtractor:
         print("✅ Fallback section created correctly")
     
     # TEST 4: Check header/footer filtering
-    def test_header_footer_filtering(self):
+    def test_header_footer_filtering(self, extractor):
         """Verify headers and footers are correctly filtered out"""
         # Test cases: (text, should_be_filtered)
         test_cases = [
@@ -65,13 +67,13 @@ class TestArabicTocExtractor:
         ]
         
         for text, should_filter in test_cases:
-            result = self.extractor._is_header_footer(text, in_toc_context=False)
+            result = extractor._is_header_footer(text, in_toc_context=False)
             assert result == should_filter
             status = "filtered" if should_filter else "kept"
             print(f"✅ '{text}' correctly {status}")
     
     # TEST 5: Check TOC entry parsing
-    def test_toc_entry_parsing(self):
+    def test_toc_entry_parsing(self, extractor):
         """Verify TOC entries are correctly parsed into sections"""
         # Sample TOC text with proper format
         # Note: First entry might be filtered, so we test with multiple entries
@@ -86,7 +88,7 @@ class TestArabicTocExtractor:
         45
         """
         
-        entries = self.extractor._parse_toc_entries(toc_text)
+        entries = extractor._parse_toc_entries(toc_text)
         
         # Verify we got entries (at least 2, since first might be filtered)
         assert len(entries) >= 2
@@ -100,7 +102,7 @@ class TestArabicTocExtractor:
         print(f"✅ Parsed {len(entries)} TOC entries correctly")
     
     # TEST 6: Check section creation with page ranges
-    def test_section_creation(self):
+    def test_section_creation(self, extractor):
         """Verify sections are created with correct page ranges"""
         entries = [
             {"title": "Chapter 1", "page": 1},
@@ -108,7 +110,7 @@ class TestArabicTocExtractor:
             {"title": "Chapter 3", "page": 30}
         ]
         
-        sections = self.extractor._create_sections(entries)
+        sections = extractor._create_sections(entries)
         
         # Verify correct number of sections
         assert len(sections) == 3
@@ -125,7 +127,7 @@ class TestArabicTocExtractor:
         print("✅ Sections created with correct page ranges")
     
     # TEST 7: Integration test - full extraction process
-    def test_full_extraction_with_valid_toc(self):
+    def test_full_extraction_with_valid_toc(self, extractor):
         """Test complete extraction process with valid Arabic TOC"""
         # Sample document with TOC at beginning
         # Important: Page numbers must be strictly increasing to avoid "backward" detection
@@ -145,7 +147,7 @@ class TestArabicTocExtractor:
         
         """ + ("Main content of the book with lots of text to simulate a real document. " * 200)
         
-        result = self.extractor.extract(sample_text)
+        result = extractor.extract(sample_text)
         
         # Verify extraction found something (may or may not find TOC depending on logic)
         assert result is not None
@@ -162,9 +164,9 @@ class TestArabicTocExtractor:
             print("✅ Fallback section returned (TOC not detected, which is OK)")
     
     # TEST 8: Edge case - empty text
-    def test_extraction_with_empty_text(self):
+    def test_extraction_with_empty_text(self, extractor):
         """Verify graceful handling of empty input"""
-        result = self.extractor.extract("")
+        result = extractor.extract("")
         
         assert result.bookmarks_found == False
         assert len(result.sections) == 1
@@ -173,7 +175,7 @@ class TestArabicTocExtractor:
         print("✅ Empty text handled gracefully")
     
     # TEST 9: Edge case - TOC at end of document
-    def test_toc_at_end_of_document(self):
+    def test_toc_at_end_of_document(self, extractor):
         """Verify TOC can be found at end of book"""
         # Create text with TOC at the end (common in Arabic books)
         beginning = "Main content of the book with lots of text. " * 300  # Longer beginning
@@ -195,7 +197,7 @@ class TestArabicTocExtractor:
         """
         
         sample_text = beginning + toc_at_end
-        result = self.extractor.extract(sample_text)
+        result = extractor.extract(sample_text)
         
         # Verify extraction returns something valid
         assert result is not None
@@ -216,29 +218,32 @@ if __name__ == "__main__":
 
 
 # FastAPI-specific integration test
+@pytest.fixture(scope="session")
+def client():
+    """Create one test client for FastAPI - importing the app is the slow part"""
+    from app.main import app
+    return TestClient(app)
+
+
+@pytest.mark.integration
 class TestFastAPIEndpoints:
-    """Test the FastAPI upload endpoint"""
-    
-    def setup_method(self):
-        """Create a test client for FastAPI"""
-        from app.main import app
-        self.client = TestClient(app)
+    """Test the FastAPI upload endpoint (skip with: pytest -m "not integration")"""
     
-    def test_homepage(self):
+    def test_homepage(self, client):
         """Test that the homepage loads"""
-        response = self.client.get("/")
+        response = client.get("/")
         assert response.status_code == 200
         print("✅ Homepage accessible")
     
-    def test_upload_endpoint_exists(self):
+    def test_upload_endpoint_exists(self, client):
         """Test that the upload endpoint exists"""
         # Test with no file (should return 422 or 400)
-        response = self.client.post("/upload")
+        response = client.post("/upload")
         assert response.status_code in [400, 422]
         print("✅ Upload endpoint exists and validates input")
     
     # Uncomment when you want to test actual file upload
-    # def test_upload_pdf(self):
+    # def test_upload_pdf(self, client):
     #     """Test uploading a PDF file"""
     #     # Create a mock PDF file
     #     from io import BytesIO
@@ -246,6 +251,6 @@ class TestFastAPIEndpoints:
     #     pdf_content = b"%PDF-1.4 mock content"
     #     files = {"file": ("test.pdf", BytesIO(pdf_content), "application/pdf")}
     #     
-    #     response = self.client.post("/upload", files=files)
+    #     response = client.post("/upload", files=files)
     #     assert response.status_code in [200, 201]
     #     print("✅ PDF upload works")
\ No newline at end of file
@@ -0,0 +1,77 @@
+# tests/test_arabic_toc_heuristic.py
+"""
+Unit tests for the legacy ArabicTocHeuristic.
+
+The test PDFs are written with the built-in Helvetica font plus a ToUnicode
+CMap that maps its ASCII codes to Arabic letters, so PyMuPDF extracts Arabic
+headings without an Arabic font being installed.
+"""
+
+import fitz
+import pytest
+from legacy_arabic.arabic_toc_heuristic import ArabicTocHeuristic, PARALLEL_MIN_PAGES
+
+HEADINGS = ["مقدمة", "تمهيد", "الخاتمة", "المراجع"]
+
+# One ASCII code per Arabic letter used in HEADINGS
+_LETTERS = sorted({ch for word in HEADINGS for ch in word})
+_CODES = {ch: chr(ord("a") + i) for i, ch in enumerate(_LETTERS)}
+
+
+def _to_unicode_cmap() -> bytes:
+    entries = "".join(f"<{ord(code):02X}> <{ord(ch):04X}>\n" for ch, code in _CODES.items())
+    return (
+        "/CIDInit /ProcSet findresource begin 12 dict begin begincmap\n"
+        "/CMapName /Arabic-UCS def /CMapType 2 def\n"
+        "1 begincodespacerange <00> <FF> endcodespacerange\n"
+        f"{len(_CODES)} beginbfchar\n{entries}endbfchar\n"
+        "endcmap CMapName currentdict /CMap defineresource pop end end\n"
+    ).encode()
+
+
+def _arabic_pdf(num_pages: int) -> bytes:
+    """A PDF with one heading at the top of each page, cycling through HEADINGS."""
+    doc = fitz.open()
+    try:
+        for i in range(num_pages):
+            word = HEADINGS[i % len(HEADINGS)]
+            # Glyphs are laid out in visual (right-to-left) order, as in real Arabic PDFs
+            doc.new_page().insert_text((50, 60), "".join(_CODES[ch] for ch in reversed(word)), fontname="helv")
+        font_xref = doc[0].get_fonts()[0][0]
+        cmap_xref = doc.get_new_xref()
+        doc.update_object(cmap_xref, "<<>>")
+        doc.update_stream(cmap_xref, _to_unicode_cmap())
+        doc.xref_set_key(font_xref, "ToUnicode", f"{cmap_xref} 0 R")
+        return doc.tobytes()
+    finally:
+        doc.close()
+
+
+def _sequential(pdf_bytes: bytes):
+    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    try:
+        return ArabicTocHeuristic().extract_doc(doc)
+    finally:
+        doc.close()
+
+
+class TestArabicTocHeuristic:
+    """extract() must not depend on whether pages are scanned in a process pool."""
+
+    @pytest.mark.parametrize("num_pages", [PARALLEL_MIN_PAGES - 1, PARALLEL_MIN_PAGES + 30])
+    def test_extract_matches_sequential_scan(self, num_pages):
+        pdf_bytes = _arabic_pdf(num_pages)
+
+        report = ArabicTocHeuristic().extract(pdf_bytes)
+
+        assert report == _sequential(pdf_bytes)
+        assert len(report.sections) == num_pages
+        assert [s.title for s in report.sections[:4]] == HEADINGS
+        assert report.sections[-1].page_end == num_pages
+
+    def test_sections_identical_across_threshold(self):
+        """The pages shared by a small and a large document yield the same sections."""
+        small = ArabicTocHeuristic().extract(_arabic_pdf(PARALLEL_MIN_PAGES - 1))
+        large = ArabicTocHeuristic().extract(_arabic_pdf(PARALLEL_MIN_PAGES + 30))
+
+        assert small.sections[:-1] == large.sections[:PARALLEL_MIN_PAGES - 2]
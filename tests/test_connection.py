@@ -1,4 +1,5 @@
 import os
+import pytest
 from sqlalchemy import create_engine
 from dotenv import load_dotenv
 
@@ -6,10 +7,17 @@ load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-try:
-    engine = create_engine(DATABASE_URL)
-    connection = engine.connect()
-    print("✅ Database connection successful!")
-    connection.close()
-except Exception as e:
-    print(f"❌ Connection failed: {e}")
\ No newline at end of file
+
+@pytest.fixture(scope="session")
+def engine():
+    """One engine per test session; connections are checked before reuse"""
+    engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.skipif(not DATABASE_URL, reason="DATABASE_URL is not set")
+def test_database_connection(engine):
+    """Verify the configured database accepts connections"""
+    with engine.connect():
+        print("✅ Database connection successful!")
@@ -8,15 +8,24 @@ Tests pattern matching for various English TOC formats.
 import pytest
 from app.services.extraction.english_toc_extractor import EnglishTocExtractor
 
+# Filler text and an over-long title, built once at import
+PAD_X = "x" * 1000
+PAD_Y = "y" * 1000
+PAD_Z = "z" * 1000
+LONG_TITLE = "A" * 250
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    """One extractor for the module - extract() keeps no state between calls."""
+    return EnglishTocExtractor(min_sections=2)
+
+
 @pytest.mark.skip(reason="English extractor tests - Phase 2 WIP")
 class TestEnglishTocExtractor:
     """Test suite for English TOC extraction."""
     
-    def setup_method(self):
-        """Setup test fixtures."""
-        self.extractor = EnglishTocExtractor(min_sections=2)
-    
-    def test_chapter_format_basic(self):
+    def test_chapter_format_basic(self, extractor):
         """Test basic 'Chapter N: Title' format."""
         text = """
         Chapter 1: Introduction
@@ -29,7 +38,7 @@ class TestEnglishTocExtractor:
         The methodology section.
         """
         
-        report = self.extractor.extract(text, num_pages=100)
+        report = extractor.extract(text, num_pages=100)
         
         assert len(report.sections) == 3
         assert report.sections[0].title == "Introduction"
@@ -37,7 +46,7 @@ class TestEnglishTocExtractor:
         assert report.sections[2].title == "Methodology"
         assert not report.bookmarks_found
     
-    def test_chapter_format_uppercase(self):
+    def test_chapter_format_uppercase(self, extractor):
         """Test uppercase 'CHAPTER N: TITLE' format."""
         text = """
         CHAPTER 1: INTRODUCTION
@@ -47,13 +56,13 @@ class TestEnglishTocExtractor:
         More content.
         """
         
-        report = self.extractor.extract(text, num_pages=50)
+        report = extractor.extract(text, num_pages=50)
         
         assert len(report.sections) == 2
         assert report.sections[0].title == "INTRODUCTION"
         assert report.sections[1].title == "LITERATURE REVIEW"
     
-    def test_numbered_format(self):
+    def test_numbered_format(self, extractor):
         """Test numbered format '1. Title'."""
         text = """
         1. Introduction
@@ -69,13 +78,13 @@ class TestEnglishTocExtractor:
         Results text.
         """
         
-        report = self.extractor.extract(text, num_pages=80)
+        report = extractor.extract(text, num_pages=80)
         
         assert len(report.sections) == 4
         assert report.sections[0].section_id == "1"
         assert report.sections[0].level == 1
     
-    def test_hierarchical_numbering(self):
+    def test_hierarchical_numbering(self, extractor):
         """Test hierarchical numbering (1, 1.1, 1.2, 2, 2.1)."""
         text = """
         1. Introduction
@@ -97,7 +106,7 @@ class TestEnglishTocExtractor:
         Analysis subsection.
         """
         
-        report = self.extractor.extract(text, num_pages=100)
+        report = extractor.extract(text, num_pages=100)
         
         assert len(report.sections) >= 4  # At least top-level sections
         
@@ -111,7 +120,7 @@ class TestEnglishTocExtractor:
         assert len(level_1_sections) >= 2
         assert len(level_2_sections) >= 2
     
-    def test_section_format(self):
+    def test_section_format(self, extractor):
         """Test 'Section N: Title' format."""
         text = """
         Section 1: Overview
@@ -124,13 +133,13 @@ class TestEnglishTocExtractor:
         Architecture details.
         """
         
-        report = self.extractor.extract(text, num_pages=60)
+        report = extractor.extract(text, num_pages=60)
         
         assert len(report.sections) >= 2
         section_titles = [s.title for s in report.sections]
         assert "Overview" in section_titles or "Implementation" in section_titles
     
-    def test_part_format(self):
+    def test_part_format(self, extractor):
         """Test 'Part N: Title' format."""
         text = """
         Part I: Foundations
@@ -143,12 +152,12 @@ class TestEnglishTocExtractor:
         Another format.
         """
         
-        report = self.extractor.extract(text, num_pages=120)
+        report = extractor.extract(text, num_pages=120)
         
         # Should find at least some sections
         assert len(report.sections) >= 1
     
-    def test_appendix_format(self):
+    def test_appendix_format(self, extractor):
         """Test 'Appendix X: Title' format."""
         text = """
         Chapter 1: Main Content
@@ -161,13 +170,13 @@ class TestEnglishTocExtractor:
         More appendix.
         """
         
-        report = self.extractor.extract(text, num_pages=100)
+        report = extractor.extract(text, num_pages=100)
         
         assert len(report.sections) >= 2
         titles = [s.title for s in report.sections]
         assert "Supplementary Data" in titles or "Main Content" in titles
     
-    def test_mixed_formats(self):
+    def test_mixed_formats(self, extractor):
         """Test document with mixed heading formats."""
         text = """
         CHAPTER 1: INTRODUCTION
@@ -189,24 +198,24 @@ class TestEnglishTocExtractor:
         Appendix.
         """
         
-        report = self.extractor.extract(text, num_pages=150)
+        report = extractor.extract(text, num_pages=150)
         
         # Should extract multiple sections despite mixed formats
         assert len(report.sections) >= 3
     
-    def test_page_range_calculation(self):
+    def test_page_range_calculation(self, extractor):
         """Test that page ranges are calculated correctly."""
         text = """
         Chapter 1: First
-        """ + ("x" * 1000) + """
+        """ + PAD_X + """
         
         Chapter 2: Second
-        """ + ("y" * 1000) + """
+        """ + PAD_Y + """
         
         Chapter 3: Third
-        """ + ("z" * 1000)
+        """ + PAD_Z
         
-        report = self.extractor.extract(text, num_pages=100)
+        report = extractor.extract(text, num_pages=100)
         
         assert len(report.sections) == 3
         
@@ -222,7 +231,7 @@ class TestEnglishTocExtractor:
         # Last section should end at last page
         assert report.sections[-1].page_end == 100
     
-    def test_insufficient_sections_fallback(self):
+    def test_insufficient_sections_fallback(self, extractor):
         """Test fallback when insufficient sections found."""
         text = """
         Chapter 1: Only One Chapter
@@ -230,14 +239,14 @@ class TestEnglishTocExtractor:
         """
         
         # With min_sections=2, this should trigger fallback
-        report = self.extractor.extract(text, num_pages=50)
+        report = extractor.extract(text, num_pages=50)
         
         assert len(report.sections) == 1
         assert report.sections[0].title == "Document"
         assert report.sections[0].page_start == 1
         assert report.sections[0].page_end == 50
     
-    def test_duplicate_removal(self):
+    def test_duplicate_removal(self, extractor):
         """Test that duplicate sections are removed."""
         text = """
         Chapter 1: Introduction
@@ -250,7 +259,7 @@ class TestEnglishTocExtractor:
         Different section.
         """
         
-        report = self.extractor.extract(text, num_pages=100)
+        report = extractor.extract(text, num_pages=100)
         
         # Should only have 2 unique sections
         assert len(report.sections) == 2
@@ -259,7 +268,7 @@ class TestEnglishTocExtractor:
         titles = [s.title for s in report.sections]
         assert len(titles) == len(set(titles))
     
-    def test_short_title_filtering(self):
+    def test_short_title_filtering(self, extractor):
         """Test that very short titles are filtered out."""
         text = """
         Chapter 1: A
@@ -272,7 +281,7 @@ class TestEnglishTocExtractor:
         Also too short.
         """
         
-        report = self.extractor.extract(text, num_pages=100)
+        report = extractor.extract(text, num_pages=100)
         
         # Should only extract the section with proper title
         titles = [s.title for s in report.sections]
@@ -280,54 +289,54 @@ class TestEnglishTocExtractor:
         assert "A" not in titles
         assert "XY" not in titles
     
-    def test_very_long_title_filtering(self):
+    def test_very_long_title_filtering(self, extractor):
         """Test that unreasonably long titles are filtered out."""
         text = """
         Chapter 1: This is a normal title
         Normal content.
         
-        Chapter 2: """ + ("A" * 250) + """
+        Chapter 2: """ + LONG_TITLE + """
         This title is way too long and is probably not a real chapter title.
         
         Chapter 3: Another normal title
         More content.
         """
         
-        report = self.extractor.extract(text, num_pages=100)
+        report = extractor.extract(text, num_pages=100)
         
         # Should only extract sections with reasonable title lengths
         for section in report.sections:
             assert len(section.title) <= 200
     
-    def test_level_determination(self):
+    def test_level_determination(self, extractor):
         """Test that hierarchical levels are correctly determined."""
         # Test various number formats
-        assert self.extractor._determine_level("1") == 1
-        assert self.extractor._determine_level("1.1") == 2
-        assert self.extractor._determine_level("1.1.1") == 3
-        assert self.extractor._determine_level("2.3.4.5") == 4
+        assert extractor._determine_level("1") == 1
+        assert extractor._determine_level("1.1") == 2
+        assert extractor._determine_level("1.1.1") == 3
+        assert extractor._determine_level("2.3.4.5") == 4
     
-    def test_section_number_parsing(self):
+    def test_section_number_parsing(self, extractor):
         """Test section number parsing for sorting."""
         # Test numeric parsing
-        assert self.extractor._parse_section_number("1") == (1,)
-        assert self.extractor._parse_section_number("1.2") == (1, 2)
-        assert self.extractor._parse_section_number("1.10.3") == (1, 10, 3)
+        assert extractor._parse_section_number("1") == (1,)
+        assert extractor._parse_section_number("1.2") == (1, 2)
+        assert extractor._parse_section_number("1.10.3") == (1, 10, 3)
         
         # Test that 1.10 comes after 1.2 (not lexicographic)
-        num_1_2 = self.extractor._parse_section_number("1.2")
-        num_1_10 = self.extractor._parse_section_number("1.10")
+        num_1_2 = extractor._parse_section_number("1.2")
+        num_1_10 = extractor._parse_section_number("1.10")
         assert num_1_10 > num_1_2
     
-    def test_empty_text(self):
+    def test_empty_text(self, extractor):
         """Test behavior with empty text."""
-        report = self.extractor.extract("", num_pages=10)
+        report = extractor.extract("", num_pages=10)
         
         # Should return fallback
         assert len(report.sections) == 1
         assert report.sections[0].title == "Document"
     
-    def test_no_matching_patterns(self):
+    def test_no_matching_patterns(self, extractor):
         """Test document with no matching patterns."""
         text = """
         This is just regular text without any chapter headings
@@ -338,13 +347,13 @@ class TestEnglishTocExtractor:
         numbering that would indicate sections or chapters.
         """
         
-        report = self.extractor.extract(text, num_pages=50)
+        report = extractor.extract(text, num_pages=50)
         
         # Should return fallback
         assert len(report.sections) == 1
         assert report.sections[0].title == "Document"
     
-    def test_case_insensitive_matching(self):
+    def test_case_insensitive_matching(self, extractor):
         """Test that pattern matching is case-insensitive."""
         text = """
         chapter 1: lowercase chapter
@@ -357,7 +366,7 @@ class TestEnglishTocExtractor:
         Even more content.
         """
         
-        report = self.extractor.extract(text, num_pages=100)
+        report = extractor.extract(text, num_pages=100)
         
         # All three should be detected
         assert len(report.sections) == 3
@@ -0,0 +1,83 @@
+# tests/test_language_validation_common.py
+"""
+Unit tests for the helpers shared by the language-detection validation scripts.
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from scripts.validation import language_validation_common as common
+from scripts.validation.language_validation_common import arabic_count
+
+# The two settings reference_detect() reads for its cache key
+SETTINGS = SimpleNamespace(USE_FASTTEXT_DETECTION=True, ARABIC_RATIO_THRESHOLD=0.3)
+
+
+class TestArabicCount:
+    """arabic_count() must count every Arabic block, not just U+0600-U+06FF."""
+
+    def test_core_block(self):
+        assert arabic_count("مقدمة") == 5
+
+    def test_presentation_forms(self):
+        """Garbled PyMuPDF output often uses the presentation forms."""
+        forms_a = "\uFB50\uFBB1\uFDF2\uFDFF"  # Presentation Forms-A, both edges
+        forms_b = "\uFE70\uFEB3\uFEFC\uFEFF"  # Presentation Forms-B, both edges
+        assert arabic_count(forms_a) == 4
+        assert arabic_count(forms_b) == 4
+
+    def test_supplement_and_extended(self):
+        supplement = "\u0750\u0766\u077F"  # Arabic Supplement, both edges
+        extended = "\u08A0\u08FF"          # Arabic Extended-A, both edges
+        assert arabic_count(supplement + extended) == 5
+
+    def test_ignores_latin_and_neighbouring_blocks(self):
+        # Syriac U+074F and Thaana U+0780 border the Supplement; U+FB4F is Hebrew
+        assert arabic_count("Chapter 1 \u074F\u0780\uFB4F") == 0
+        assert arabic_count("") == 0
+
+    def test_mixed_text(self):
+        assert arabic_count("Page 5: الفصل \uFEB3\u0750") == 7
+
+
+class _Detector:
+    """Stand-in for LanguageDetector that counts detect() calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def detect(self, pdf_bytes):
+        self.calls += 1
+        return "arabic", "نص", None
+
+
+class TestReferenceDetect:
+    """reference_detect() caches on disk and survives bad cache entries."""
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(common, "CACHE_DIR", tmp_path)
+        return tmp_path
+
+    def test_second_call_uses_cache(self, cache_dir):
+        detector = _Detector()
+
+        first = common.reference_detect(detector, b"%PDF-1", SETTINGS)
+        second = common.reference_detect(detector, b"%PDF-1", SETTINGS)
+
+        assert first == second == ("arabic", "نص")
+        assert detector.calls == 1
+        assert [p.suffix for p in cache_dir.iterdir()] == [".json"]
+
+    def test_corrupt_entry_is_a_miss(self, cache_dir):
+        detector = _Detector()
+        common.reference_detect(detector, b"%PDF-1", SETTINGS)
+        (entry,) = cache_dir.iterdir()
+        entry.write_text('{"language": "ara', encoding="utf-8")
+
+        result = common.reference_detect(detector, b"%PDF-1", SETTINGS)
+
+        assert result == ("arabic", "نص")
+        assert detector.calls == 2
+        assert json.loads(entry.read_text(encoding="utf-8"))["language"] == "arabic"
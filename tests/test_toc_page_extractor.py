@@ -0,0 +1,94 @@
+# tests/test_toc_page_extractor.py
+"""
+Unit tests for the legacy Arabic TocPageExtractor.
+
+Pages are served from an in-memory stand-in for fitz.Document, so the tests
+need no Arabic font and can record which pages parse_doc() loads.
+"""
+
+import pytest
+from legacy_arabic.toc_page_extractor import (
+    DENSE_TOC_LINES,
+    PREFERRED_TOC_PAGE_INDEX,
+    TocPageExtractor,
+)
+
+TITLES = ["مقدمة الكتاب", "الفصل الأول", "الفصل الثاني", "الفصل الثالث",
+          "الفصل الرابع", "الفصل الخامس", "الفصل السادس", "الفصل السابع",
+          "الفصل الثامن", "الفصل التاسع", "الفصل العاشر", "الخاتمة"]
+
+
+class _Page:
+    def __init__(self, text):
+        self._text = text
+
+    def get_text(self, kind="text"):
+        return self._text
+
+
+class _Doc:
+    """Minimal fitz.Document: page_count and load_page(), logging each load."""
+
+    def __init__(self, texts):
+        self._texts = texts
+        self.loaded = []
+
+    @property
+    def page_count(self):
+        return len(self._texts)
+
+    def load_page(self, i):
+        self.loaded.append(i)
+        return _Page(self._texts[i])
+
+
+def _toc_page(n_lines, keyword=True):
+    """A TOC page with one "title ... page" entry per line."""
+    lines = ["المحتويات"] if keyword else []
+    lines += [f"{TITLES[k]} .......... {10 * (k + 1)}" for k in range(n_lines)]
+    return "\n".join(lines)
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    """One extractor for the module - parse_doc() keeps no state between calls."""
+    return TocPageExtractor()
+
+
+class TestTocPageExtractor:
+    """Test suite for TOC page detection and parsing."""
+
+    def test_parses_one_entry_per_line(self, extractor):
+        """Each line of the TOC page becomes its own section."""
+        texts = ["نص"] * 200
+        texts[PREFERRED_TOC_PAGE_INDEX] = _toc_page(4)
+
+        report = extractor.parse_doc(_Doc(texts))
+
+        assert report is not None
+        assert [s.title for s in report.sections] == TITLES[:4]
+        assert [s.page_start for s in report.sections] == [10, 20, 30, 40]
+        assert report.sections[0].page_end == 19
+        assert report.sections[-1].page_end == 200
+
+    def test_dense_labeled_page_stops_scan(self, extractor):
+        """A labeled page with DENSE_TOC_LINES entries ends the candidate scan."""
+        texts = ["نص"] * 200
+        texts[PREFERRED_TOC_PAGE_INDEX] = _toc_page(DENSE_TOC_LINES)
+        doc = _Doc(texts)
+
+        report = extractor.parse_doc(doc)
+
+        assert doc.loaded == [PREFERRED_TOC_PAGE_INDEX]
+        assert len(report.sections) == DENSE_TOC_LINES
+
+    def test_sparse_page_scans_all_candidates(self, extractor):
+        """Below DENSE_TOC_LINES every candidate page is still checked."""
+        texts = ["نص"] * 200
+        texts[PREFERRED_TOC_PAGE_INDEX] = _toc_page(DENSE_TOC_LINES - 1)
+        doc = _Doc(texts)
+
+        report = extractor.parse_doc(doc)
+
+        assert len(doc.loaded) > 1
+        assert len(report.sections) == DENSE_TOC_LINES - 1
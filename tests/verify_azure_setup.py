@@ -22,6 +22,9 @@ print("\n📋 Step 1: Checking Environment Variables\n")
 from dotenv import load_dotenv
 load_dotenv()
 
+# Read the environment once; every check below uses this snapshot
+env = os.environ.copy()
+
 required_vars = {
     "DATABASE_URL": "Azure PostgreSQL connection string",
     "AZURE_DOCUMENT_INTELLIGENCE_ENDPOINT": "Document Intelligence endpoint",
@@ -33,7 +36,7 @@ required_vars = {
 all_vars_present = True
 
 for var_name, description in required_vars.items():
-    value = os.getenv(var_name)
+    value = env.get(var_name)
     if value:
         # Mask sensitive values
         if "KEY" in var_name or "PASSWORD" in var_name or "CONNECTION_STRING" in var_name:
@@ -69,7 +72,7 @@ try:
 
     # Check if Book table has new columns
     if 'books' in tables:
-        columns = [col['name'] for col in inspector.get_columns('books')]
+        columns = {col['name'] for col in inspector.get_columns('books')}
         required_columns = [
             'html_url', 'markdown_url', 'pages_jsonl_url',
             'sections_jsonl_url', 'pdf_url', 'cover_image_url',
@@ -101,8 +104,8 @@ except Exception as e:
 # ============================================================================
 print("\n📋 Step 3: Checking Azure Blob Storage\n")
 
-connection_string = os.getenv("AZURE_STORAGE_CONNECTION_STRING")
-container_name = os.getenv("AZURE_STORAGE_CONTAINER_NAME", "books")
+connection_string = env.get("AZURE_STORAGE_CONNECTION_STRING")
+container_name = env.get("AZURE_STORAGE_CONTAINER_NAME", "books")
 
 if not connection_string:
     print("   ❌ AZURE_STORAGE_CONNECTION_STRING not set in .env")
@@ -120,12 +123,15 @@ else:
             print(f"   ✅ Azure Blob Storage connection successful!")
             print(f"   ✅ Container '{container_name}' exists")
 
-            # List blobs (if any)
-            blobs = list(container_client.list_blobs())
+            # List blobs (if any): only the first page of 5 carries full
+            # properties; the total is counted from a names-only listing
+            pages = container_client.list_blobs(results_per_page=5).by_page()
+            blobs = list(next(pages, []))
             if blobs:
-                print(f"   📁 Files in container: {len(blobs)}")
+                blob_count = sum(1 for _ in container_client.list_blob_names())
+                print(f"   📁 Files in container: {blob_count}")
                 print(f"      Recent files:")
-                for blob in blobs[:5]:  # Show first 5
+                for blob in blobs:  # Show first 5
                     size_kb = blob.size / 1024
                     print(f"      - {blob.name} ({size_kb:.1f} KB)")
             else:
@@ -153,9 +159,10 @@ if azure_service_path.exists():
 
     # Check if it's being used
     generation_path = Path(__file__).parent.parent / "app" / "routers" / "generation.py"
-    with open(generation_path, 'r', encoding='utf-8') as f:
+    # Byte-level search: the marker is ASCII, so no decode is needed
+    with open(generation_path, 'rb') as f:
         content = f.read()
-        if 'azure_storage' in content:
+        if b'azure_storage' in content:
             print(f"   ✅ generation.py is using azure_storage")
         else:
             print(f"   ⚠️  generation.py is still using local_storage")
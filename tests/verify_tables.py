@@ -1,4 +1,6 @@
+import io
 import sys
+from contextlib import redirect_stdout
 from pathlib import Path
 
 # Add parent directory to path so we can import app module
@@ -7,14 +9,31 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from app.models.database import engine
 from sqlalchemy import inspect
 
-inspector = inspect(engine)
-tables = inspector.get_table_names()
-
-print("✅ Tables in database:")
-for table in tables:
-    print(f"\n📋 Table: {table}")
-    columns = inspector.get_columns(table)
-    for col in columns:
-        col_type = str(col['type'])
-        nullable = "NULL" if col['nullable'] else "NOT NULL"
-        print(f"   - {col['name']}: {col_type} ({nullable})")
\ No newline at end of file
+
+def _report():
+    inspector = inspect(engine)
+    tables = inspector.get_table_names()
+
+    print("✅ Tables in database:")
+    for table in tables:
+        print(f"\n📋 Table: {table}")
+        columns = inspector.get_columns(table)
+        for col in columns:
+            col_type = str(col['type'])
+            nullable = "NULL" if col['nullable'] else "NOT NULL"
+            print(f"   - {col['name']}: {col_type} ({nullable})")
+
+
+def main():
+    # Buffer the table listing and print it in one go
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            _report()
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()